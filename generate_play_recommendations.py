@@ -13,10 +13,13 @@ Output:
 import sys
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from data.loader import NFLDataLoader, extract_ball_in_air_frames
+from data.loader import NFLDataLoader, TRACKING_MIN_COLS, extract_ball_in_air_frames
 from selection.play_recommender import PlayRecommender
 
 
@@ -138,7 +141,13 @@ def main():
         ]
 
         csv_path = output_dir / 'top_20_plays.csv'
-        top_20[export_cols].to_csv(csv_path, index=False)
+        # Arrow's C++ writer encodes columns without a per-cell Python loop
+        pacsv.write_csv(
+            pa.Table.from_pandas(top_20[export_cols], preserve_index=False),
+            csv_path,
+            # Same values as DataFrame.to_csv when read back; Arrow still quotes strings
+            write_options=pacsv.WriteOptions(quoting_style="needed")
+        )
         print(f"   ✅ {csv_path}")
     except Exception as e:
         print(f"   ❌ Error: {e}")
@@ -165,7 +174,9 @@ def main():
 
         # Load tracking
         print("Loading tracking data...")
-        tracking = loader.get_play_tracking(game_id, play_id, week=metadata['week'])
+        tracking = loader.get_play_tracking(
+            game_id, play_id, week=metadata['week'], columns=TRACKING_MIN_COLS
+        )
 
         # Extract ball-in-air
         print("Extracting ball-in-air period...")
@@ -200,9 +211,9 @@ def main():
     print("Statistics:")
     print(f"  Average Air Yards: {top_20['passLength'].mean():.1f}")
     print(f"  Average Score: {top_20['total_score'].mean():.2f}/10")
-    print(f"  Touchdowns: {len(top_20[top_20['playDescription'].str.contains('TOUCHDOWN', case=False, na=False)])}")
-    print(f"  Interceptions: {len(top_20[top_20['passResult'] == 'IN'])}")
-    print(f"  4th Quarter: {len(top_20[top_20['quarter'] == 4])}")
+    print(f"  Touchdowns: {int(top_20['is_touchdown'].sum())}")
+    print(f"  Interceptions: {int(top_20['passResult'].eq('IN').sum())}")
+    print(f"  4th Quarter: {int(top_20['quarter'].eq(4).sum())}")
     print()
 
     print("Next Steps:")
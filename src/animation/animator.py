@@ -34,6 +34,8 @@ class PlayAnimator:
             fps: Frames per second for animation
         """
         self.tracking = tracking_data.sort_values('frameId')
+        if not isinstance(self.tracking['club'].dtype, pd.CategoricalDtype):
+            self.tracking['club'] = self.tracking['club'].astype('category')
         self.figsize = figsize
         self.fps = fps
 
@@ -45,6 +47,54 @@ class PlayAnimator:
         self.ball_tracking = self.tracking[self.tracking['club'] == 'football'].copy()
         self.player_tracking = self.tracking[self.tracking['club'] != 'football'].copy()
 
+        # Per-player (frame ids, xy positions, team) for slicing movement trails
+        self._player_trails = {
+            nfl_id: (
+                player['frameId'].to_numpy(),
+                player[['x', 'y']].to_numpy(),
+                player['club'].iloc[-1]
+            )
+            for nfl_id, player in self.player_tracking.groupby('nflId', sort=False)
+        }
+
+        # Fixed slot per player so all speed vectors live in one quiver
+        self._player_slot = {nfl_id: i for i, nfl_id in enumerate(self._player_trails)}
+
+        # Struct-of-arrays copy of the frame-sorted player rows; each animation
+        # frame is a contiguous slice of these columns
+        self._x = self.player_tracking['x'].to_numpy()
+        self._y = self.player_tracking['y'].to_numpy()
+        self._speed = self.player_tracking['s'].to_numpy()
+        self._dir = self.player_tracking['dir'].to_numpy()
+        jerseys = self.player_tracking['jerseyNumber'].to_numpy(dtype=float, na_value=np.nan)
+        self._jersey_label = np.array(
+            ['' if np.isnan(number) else str(int(number)) for number in jerseys],
+            dtype=object
+        )
+        self._nfl_id = self.player_tracking['nflId'].to_numpy()
+        self._club_code = self.player_tracking['club'].cat.codes.to_numpy()
+        self._event = self.player_tracking['event'].to_numpy()
+        self._slot = self.player_tracking['nflId'].map(self._player_slot).fillna(-1).to_numpy(dtype=int)
+
+        frames = np.asarray(self.frames)
+        player_frame_ids = self.player_tracking['frameId'].to_numpy()
+        self._player_slices = [
+            slice(start, end) for start, end in zip(
+                np.searchsorted(player_frame_ids, frames, side='left'),
+                np.searchsorted(player_frame_ids, frames, side='right')
+            )
+        ]
+
+        # Ball rows are ordered by frame, so the trajectory up to a frame is a prefix
+        self._ball_xy = self.ball_tracking[['x', 'y']].to_numpy()
+        ball_frame_ids = self.ball_tracking['frameId'].to_numpy()
+        self._ball_slices = [
+            slice(start, end) for start, end in zip(
+                np.searchsorted(ball_frame_ids, frames, side='left'),
+                np.searchsorted(ball_frame_ids, frames, side='right')
+            )
+        ]
+
     def create_animation(
         self,
         title: str = "NFL Play Animation",
@@ -72,14 +122,6 @@ class PlayAnimator:
         field = NFLField(figsize=self.figsize)
         fig, ax = field.create_field()
 
-        # Initialize plot elements
-        self.player_scatter = None
-        self.ball_scatter = None
-        self.trail_lines = []
-        self.speed_arrows = []
-        self.ball_trajectory_line = None
-        self.frame_text = None
-
         # Color mapping
         if color_map is None:
             # Get unique teams
@@ -92,11 +134,95 @@ class PlayAnimator:
 
         self.color_map = color_map
         self.field = field
+
+        # Color per club category; the trailing entry catches code -1 (missing club)
+        clubs = self.player_tracking['club'].cat.categories
+        self._color_lut = np.array([color_map.get(club, 'gray') for club in clubs] + ['gray'])
         self.show_trails = show_trails
         self.trail_length = trail_length
         self.show_speed_vectors = show_speed_vectors
         self.show_ball_trajectory = show_ball_trajectory
 
+        # Plot elements are created once and updated in place every frame
+        self.player_scatter = ax.scatter(
+            np.empty(0),
+            np.empty(0),
+            s=200,
+            alpha=0.9,
+            edgecolors='white',
+            linewidths=2,
+            zorder=10
+        )
+        self.ball_scatter = ax.scatter(
+            np.empty(0),
+            np.empty(0),
+            c=self.color_map['football'],
+            s=150,
+            marker='o',
+            alpha=1.0,
+            edgecolors='white',
+            linewidths=2,
+            zorder=12
+        )
+        self.ball_trajectory_line, = ax.plot(
+            [], [],
+            color=self.color_map['football'],
+            linewidth=2,
+            linestyle='--',
+            alpha=0.5,
+            zorder=9
+        )
+
+        self.trail_lines = {}
+        if show_trails:
+            for nfl_id, (_, _, team) in self._player_trails.items():
+                self.trail_lines[nfl_id], = ax.plot(
+                    [], [],
+                    color=self.color_map.get(team, 'gray'),
+                    linewidth=1.5,
+                    alpha=0.3,
+                    zorder=5
+                )
+
+        self.speed_quiver = None
+        if show_speed_vectors and self._player_trails:
+            n_players = len(self._player_trails)
+            self.speed_quiver = ax.quiver(
+                np.zeros(n_players),
+                np.zeros(n_players),
+                np.zeros(n_players),
+                np.zeros(n_players),
+                color=[self.color_map.get(team, 'gray') for _, _, team in self._player_trails.values()],
+                angles='xy',
+                scale_units='xy',
+                scale=1,
+                units='xy',
+                width=0.15,
+                headwidth=6.5,
+                headlength=5,
+                headaxislength=4.5,
+                minlength=0,
+                alpha=0.6,
+                zorder=9
+            )
+
+        # One reusable label per player slot in the busiest frame
+        max_players = max((sl.stop - sl.start for sl in self._player_slices), default=0)
+        self.jersey_texts = [
+            ax.text(
+                0, 0,
+                '',
+                color='white',
+                fontsize=7,
+                fontweight='bold',
+                ha='center',
+                va='center',
+                zorder=11,
+                visible=False
+            )
+            for _ in range(max_players)
+        ]
+
         # Add title
         field.add_title(title)
 
@@ -116,164 +242,104 @@ class PlayAnimator:
             self._update_frame,
             frames=self.n_frames,
             interval=1000 / self.fps,
-            blit=False,
+            blit=True,
             repeat=True
         )
 
         return anim
 
-    def _update_frame(self, frame_idx: int):
+    def _update_frame(self, frame_idx: int) -> List:
         """
         Update function for each frame of animation.
 
         Args:
             frame_idx: Index of current frame
+
+        Returns:
+            Artists modified in this frame (for blitting)
         """
         current_frame_id = self.frames[frame_idx]
 
-        # Get data for current frame
-        frame_data = self.player_tracking[
-            self.player_tracking['frameId'] == current_frame_id
-        ]
-
-        ball_data = self.ball_tracking[
-            self.ball_tracking['frameId'] == current_frame_id
-        ]
-
-        # Clear previous scatter plots
-        if self.player_scatter is not None:
-            self.player_scatter.remove()
-        if self.ball_scatter is not None:
-            self.ball_scatter.remove()
+        # Rows for current frame
+        sl = self._player_slices[frame_idx]
+        ball_sl = self._ball_slices[frame_idx]
+        x = self._x[sl]
+        y = self._y[sl]
 
         # Plot players
-        if len(frame_data) > 0:
-            colors = [self.color_map.get(team, 'gray') for team in frame_data['club']]
-
-            self.player_scatter = self.field.ax.scatter(
-                frame_data['x'],
-                frame_data['y'],
-                c=colors,
-                s=200,
-                alpha=0.9,
-                edgecolors='white',
-                linewidths=2,
-                zorder=10
-            )
-
-            # Add jersey numbers
-            for _, player in frame_data.iterrows():
-                if pd.notna(player['jerseyNumber']):
-                    self.field.ax.text(
-                        player['x'],
-                        player['y'],
-                        str(int(player['jerseyNumber'])),
-                        color='white',
-                        fontsize=7,
-                        fontweight='bold',
-                        ha='center',
-                        va='center',
-                        zorder=11
-                    )
+        self.player_scatter.set_offsets(np.column_stack([x, y]))
+        if sl.stop > sl.start:
+            self.player_scatter.set_facecolor(self._color_lut[self._club_code[sl]])
+
+        # Add jersey numbers
+        labels = self._jersey_label[sl]
+        for i, text in enumerate(self.jersey_texts):
+            if i < len(labels) and labels[i]:
+                text.set_position((x[i], y[i]))
+                text.set_text(labels[i])
+                text.set_visible(True)
+            else:
+                text.set_visible(False)
 
         # Plot ball
-        if len(ball_data) > 0:
-            self.ball_scatter = self.field.ax.scatter(
-                ball_data['x'],
-                ball_data['y'],
-                c=self.color_map['football'],
-                s=150,
-                marker='o',
-                alpha=1.0,
-                edgecolors='white',
-                linewidths=2,
-                zorder=12
-            )
+        self.ball_scatter.set_offsets(self._ball_xy[ball_sl])
 
         # Show ball trajectory up to current frame
         if self.show_ball_trajectory:
-            ball_history = self.ball_tracking[
-                self.ball_tracking['frameId'] <= current_frame_id
-            ]
+            ball_history = self._ball_xy[:ball_sl.stop]
 
             if len(ball_history) > 1:
-                if self.ball_trajectory_line is not None:
-                    self.ball_trajectory_line.remove()
-
-                self.ball_trajectory_line, = self.field.ax.plot(
-                    ball_history['x'],
-                    ball_history['y'],
-                    color=self.color_map['football'],
-                    linewidth=2,
-                    linestyle='--',
-                    alpha=0.5,
-                    zorder=9
-                )
+                self.ball_trajectory_line.set_data(ball_history[:, 0], ball_history[:, 1])
+            else:
+                self.ball_trajectory_line.set_data([], [])
 
         # Show trails
         if self.show_trails:
-            # Remove old trails
-            for line in self.trail_lines:
-                line.remove()
-            self.trail_lines = []
-
             # Get historical frames for trails
             trail_start_frame = max(0, frame_idx - self.trail_length)
-            trail_frame_ids = self.frames[trail_start_frame:frame_idx + 1]
-
-            # Plot trail for each player
-            for nfl_id in frame_data['nflId'].unique():
-                if pd.notna(nfl_id):
-                    player_trail = self.player_tracking[
-                        (self.player_tracking['nflId'] == nfl_id) &
-                        (self.player_tracking['frameId'].isin(trail_frame_ids))
-                    ].sort_values('frameId')
-
-                    if len(player_trail) > 1:
-                        team = player_trail.iloc[-1]['club']
-                        color = self.color_map.get(team, 'gray')
-
-                        line, = self.field.ax.plot(
-                            player_trail['x'],
-                            player_trail['y'],
-                            color=color,
-                            linewidth=1.5,
-                            alpha=0.3,
-                            zorder=5
-                        )
-                        self.trail_lines.append(line)
+            trail_first_id = self.frames[trail_start_frame]
+            on_field = set(self._nfl_id[sl])
+
+            # Update trail for each player
+            for nfl_id, line in self.trail_lines.items():
+                frame_ids, xy, _ = self._player_trails[nfl_id]
+                start = np.searchsorted(frame_ids, trail_first_id, side='left')
+                end = np.searchsorted(frame_ids, current_frame_id, side='right')
+                player_trail = xy[start:end]
+
+                if nfl_id in on_field and len(player_trail) > 1:
+                    line.set_data(player_trail[:, 0], player_trail[:, 1])
+                else:
+                    line.set_data([], [])
 
         # Show speed vectors
-        if self.show_speed_vectors:
-            # Remove old arrows
-            for arrow in self.speed_arrows:
-                arrow.remove()
-            self.speed_arrows = []
-
-            for _, player in frame_data.iterrows():
-                if pd.notna(player['s']) and player['s'] > 0:
-                    # Calculate vector components
-                    # dir is direction in degrees
-                    dir_rad = np.radians(player['dir'])
-                    dx = player['s'] * np.cos(dir_rad) * 0.5  # Scale for visibility
-                    dy = player['s'] * np.sin(dir_rad) * 0.5
-
-                    team = player['club']
-                    color = self.color_map.get(team, 'gray')
-
-                    arrow = self.field.ax.arrow(
-                        player['x'],
-                        player['y'],
-                        dx, dy,
-                        head_width=1,
-                        head_length=0.8,
-                        fc=color,
-                        ec=color,
-                        alpha=0.6,
-                        linewidth=1.5,
-                        zorder=9
-                    )
-                    self.speed_arrows.append(arrow)
+        if self.speed_quiver is not None:
+            slots = self._slot[sl]
+            known = slots >= 0
+            slots = slots[known]
+
+            # dir is direction in degrees; all players are computed at once
+            speed = self._speed[sl][known]
+            dir_rad = np.radians(self._dir[sl][known])
+            moving = (speed > 0) & np.isfinite(dir_rad)
+            # Quiver lengths include the head, so add the 0.8 yd head that
+            # ax.arrow used to draw past the end of the vector
+            length = speed * 0.5 + 0.8  # Scale for visibility
+            dx = np.where(moving, length * np.cos(dir_rad), 0.0)
+            dy = np.where(moving, length * np.sin(dir_rad), 0.0)
+
+            # Players not on the field this frame keep a zero-length vector
+            n_players = len(self._player_slot)
+            offsets = np.zeros((n_players, 2))
+            u = np.zeros(n_players)
+            v = np.zeros(n_players)
+            offsets[slots, 0] = x[known]
+            offsets[slots, 1] = y[known]
+            u[slots] = dx
+            v[slots] = dy
+
+            self.speed_quiver.set_offsets(offsets)
+            self.speed_quiver.set_UVC(u, v)
 
         # Update frame counter
         time_elapsed = frame_idx / self.fps
@@ -282,12 +348,22 @@ class PlayAnimator:
         )
 
         # Get event for this frame
-        event = frame_data['event'].iloc[0] if len(frame_data) > 0 else None
+        event = self._event[sl.start] if sl.stop > sl.start else None
         if pd.notna(event) and event:
             self.frame_text.set_text(
                 f'Frame: {current_frame_id} | Time: {time_elapsed:.1f}s | {event}'
             )
 
+        return [
+            self.player_scatter,
+            self.ball_scatter,
+            self.ball_trajectory_line,
+            *self.trail_lines.values(),
+            *([self.speed_quiver] if self.speed_quiver is not None else []),
+            *self.jersey_texts,
+            self.frame_text
+        ]
+
     def save_animation(
         self,
         filepath: str,
@@ -2,89 +2,366 @@
 Data loading utilities for NFL Big Data Bowl 2026.
 """
 
+import os
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+# Column dtypes applied at read time. Coordinates and kinematics are recorded to
+# two decimals and fit comfortably in float32, frame ids stay well below 2**15,
+# and low-cardinality strings become categoricals so that downstream ==/isin
+# comparisons run on integer codes.
+TRACKING_DTYPES = {
+    "gameId": "int32",
+    "playId": "int32",
+    "nflId": "float32",
+    "frameId": "int16",
+    "x": "float32",
+    "y": "float32",
+    "s": "float32",
+    "a": "float32",
+    "dis": "float32",
+    "dir": "float32",
+    "o": "float32",
+    "club": "category",
+    "event": "category",
+    "jerseyNumber": "Int16",
+}
+
+GAMES_DTYPES = {
+    "gameId": "int32",
+    "season": "int16",
+    "week": "int8",
+    "homeTeamAbbr": "category",
+    "visitorTeamAbbr": "category",
+}
+
+PLAYS_DTYPES = {
+    "gameId": "int32",
+    "playId": "int32",
+    "week": "int8",
+    "quarter": "int8",
+    "down": "int8",
+    "yardsToGo": "int16",
+    "preSnapHomeScore": "int16",
+    "preSnapVisitorScore": "int16",
+    "passLength": "float32",
+    "possessionTeam": "category",
+    "defensiveTeam": "category",
+    "passResult": "category",
+    "offenseFormation": "category",
+    "pff_passCoverage": "category",
+}
+
+PLAYERS_DTYPES = {
+    "nflId": "int32",
+    "position": "category",
+}
+
+PLAYER_PLAY_DTYPES = {
+    "gameId": "int32",
+    "playId": "int32",
+    "nflId": "int32",
+}
+
+# Tracking columns needed by the animation and ball-in-air code paths
+TRACKING_MIN_COLS = [
+    'gameId', 'playId', 'frameId', 'nflId', 'x', 'y', 's', 'dir',
+    'club', 'event', 'jerseyNumber'
+]
+
+# Tracking columns kept as categoricals on every load path
+CATEGORICAL_COLUMNS = ['club', 'event']
+
+# Events marking the end of the ball-in-air window
+OUTCOME_EVENTS = np.array([
+    'pass_arrived',
+    'pass_outcome_caught',
+    'pass_outcome_incomplete',
+    'pass_outcome_interception'
+])
+
+
+def _categorize(tracking: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast tracking string columns to categoricals (no-op when already cast).
+
+    Args:
+        tracking: Tracking DataFrame, modified in place
+
+    Returns:
+        The same DataFrame
+    """
+    for column in CATEGORICAL_COLUMNS:
+        if column in tracking.columns and not isinstance(tracking[column].dtype, pd.CategoricalDtype):
+            tracking[column] = tracking[column].astype('category')
+    return tracking
+
 
 class NFLDataLoader:
     """Load and manage NFL tracking data."""
 
-    def __init__(self, data_dir: str = "data/raw"):
+    def __init__(
+        self,
+        data_dir: str = "data/raw",
+        cache_dir: Optional[str] = None,
+        max_cached_weeks: int = 2
+    ):
         """
         Initialize data loader.
 
         Args:
             data_dir: Path to directory containing raw CSV files
+            cache_dir: Directory for Parquet copies of the tracking CSVs
+                (defaults to a "cache" directory next to data_dir)
+            max_cached_weeks: Number of tracking weeks kept in memory
         """
         self.data_dir = Path(data_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.data_dir.parent / "cache"
+        self.max_cached_weeks = max_cached_weeks
         self._games = None
         self._plays = None
         self._players = None
         self._player_play = None
+        self._game_weeks = None
+        self._games_by_id = None
+        self._plays_by_id = None
+        self._tracking_cache: "OrderedDict[int, pd.DataFrame]" = OrderedDict()
+        self._tracking_cache_lock = threading.Lock()
+
+    def _read_csv(self, filename: str, dtypes: dict) -> pd.DataFrame:
+        """
+        Read a CSV with the multithreaded PyArrow parser.
+
+        Args:
+            filename: CSV file name inside data_dir
+            dtypes: Column dtype mapping (columns absent from the file are ignored)
+
+        Returns:
+            Parsed DataFrame
+        """
+        return pd.read_csv(self.data_dir / filename, engine="pyarrow", dtype=dtypes)
 
     @property
     def games(self) -> pd.DataFrame:
         """Load games data (cached)."""
         if self._games is None:
-            self._games = pd.read_csv(self.data_dir / "games.csv")
+            self._games = self._read_csv("games.csv", GAMES_DTYPES)
         return self._games
 
     @property
     def plays(self) -> pd.DataFrame:
         """Load plays data (cached)."""
         if self._plays is None:
-            self._plays = pd.read_csv(self.data_dir / "plays.csv")
+            self._plays = self._read_csv("plays.csv", PLAYS_DTYPES)
         return self._plays
 
     @property
     def players(self) -> pd.DataFrame:
         """Load players data (cached)."""
         if self._players is None:
-            self._players = pd.read_csv(self.data_dir / "players.csv")
+            self._players = self._read_csv("players.csv", PLAYERS_DTYPES)
         return self._players
 
     @property
     def player_play(self) -> pd.DataFrame:
         """Load player_play data (cached)."""
         if self._player_play is None:
-            self._player_play = pd.read_csv(self.data_dir / "player_play.csv")
+            self._player_play = self._read_csv("player_play.csv", PLAYER_PLAY_DTYPES)
         return self._player_play
 
-    def load_tracking_week(self, week: int) -> pd.DataFrame:
+    @property
+    def game_weeks(self) -> dict:
+        """Mapping of gameId to week (cached)."""
+        if self._game_weeks is None:
+            self._game_weeks = dict(zip(
+                self.games['gameId'].tolist(),
+                self.games['week'].tolist()
+            ))
+        return self._game_weeks
+
+    @property
+    def games_by_id(self) -> pd.DataFrame:
+        """Games data indexed by gameId (cached)."""
+        if self._games_by_id is None:
+            self._games_by_id = self.games.set_index('gameId', drop=False)
+        return self._games_by_id
+
+    @property
+    def plays_by_id(self) -> pd.DataFrame:
+        """Plays data indexed by (gameId, playId) (cached)."""
+        if self._plays_by_id is None:
+            self._plays_by_id = self.plays.set_index(['gameId', 'playId'], drop=False)
+        return self._plays_by_id
+
+    def _tracking_parquet_path(self, week: int) -> Path:
+        """
+        Get the Parquet copy of a tracking week, converting the CSV on first use.
+
+        Args:
+            week: Week number (1-9)
+
+        Returns:
+            Path to the Parquet file
+        """
+        csv_path = self.data_dir / f"tracking_week_{week}.csv"
+        parquet_path = self.cache_dir / f"tracking_week_{week}.parquet"
+
+        # Rebuild when missing or older than the CSV; a cached copy whose CSV
+        # has since been removed is still used
+        if not parquet_path.exists() or (
+            csv_path.exists()
+            and parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+        ):
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tracking = self._read_csv(csv_path.name, TRACKING_DTYPES)
+            # Sorted, modest row groups keep per-group gameId/playId statistics
+            # tight enough for single-play reads to skip most of the file
+            tracking = tracking.sort_values(['gameId', 'playId', 'frameId'], ignore_index=True)
+
+            # Write to a temp file and rename so an interrupted or concurrent
+            # conversion never leaves a truncated Parquet that looks fresh
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.parquet.tmp')
+            os.close(fd)
+            try:
+                tracking.to_parquet(
+                    tmp_path,
+                    compression="zstd",
+                    index=False,
+                    row_group_size=50_000
+                )
+                os.replace(tmp_path, parquet_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+        return parquet_path
+
+    def load_tracking_week(
+        self,
+        week: int,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Load tracking data for a specific week.
 
+        The most recently used full weeks are kept in memory, so the returned
+        DataFrame is shared between callers and should not be modified.
+
         Args:
             week: Week number (1-9)
+            columns: Columns to read (default: all). Column subsets are read
+                straight from Parquet and are not cached.
 
         Returns:
             DataFrame with tracking data for the week
         """
-        file_path = self.data_dir / f"tracking_week_{week}.csv"
-        return pd.read_csv(file_path)
+        week = int(week)
+        with self._tracking_cache_lock:
+            if week in self._tracking_cache:
+                self._tracking_cache.move_to_end(week)
+                tracking = self._tracking_cache[week]
+                return tracking if columns is None else tracking[columns]
+
+        if columns is not None:
+            return _categorize(
+                self.load_tracking_week_arrow(week, columns).to_pandas(self_destruct=True, split_blocks=True)
+            )
+
+        tracking = _categorize(
+            self.load_tracking_week_arrow(week).to_pandas(self_destruct=True, split_blocks=True)
+        )
+
+        with self._tracking_cache_lock:
+            self._tracking_cache[week] = tracking
+            while len(self._tracking_cache) > self.max_cached_weeks:
+                self._tracking_cache.popitem(last=False)
+
+        return tracking
+
+    def load_tracking_week_arrow(
+        self,
+        week: int,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
+        """
+        Load tracking data for a specific week as an Arrow table.
+
+        Bypasses the in-memory DataFrame cache.
+
+        Args:
+            week: Week number (1-9)
+            columns: Columns to read (default: all); others are never decoded
+
+        Returns:
+            Arrow table with tracking data for the week
+        """
+        return pq.read_table(self._tracking_parquet_path(int(week)), columns=columns)
 
-    def load_tracking_weeks(self, weeks: List[int]) -> pd.DataFrame:
+    def preload_week(self, week: int):
+        """
+        Warm the in-memory cache for a tracking week.
+
+        Args:
+            week: Week number (1-9)
+        """
+        self.load_tracking_week(week)
+
+    def load_tracking_weeks(
+        self,
+        weeks: List[int],
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Load and combine tracking data for multiple weeks.
 
+        Weeks are read concurrently as Arrow tables; the PyArrow readers
+        release the GIL, so the reads overlap on I/O and decoding. The
+        tables are concatenated without copying and converted to pandas
+        once, releasing Arrow buffers as the DataFrame is built.
+
         Args:
             weeks: List of week numbers to load
+            columns: Columns to read (default: all)
 
         Returns:
             Combined DataFrame with tracking data
         """
-        dfs = []
-        for week in weeks:
-            df = self.load_tracking_week(week)
-            dfs.append(df)
-        return pd.concat(dfs, ignore_index=True)
+        max_workers = max(1, min(len(weeks), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tables = list(executor.map(
+                lambda week: self.load_tracking_week_arrow(week, columns),
+                weeks
+            ))
+
+        table = pa.concat_tables(tables)
+        del tables
+
+        return _categorize(table.to_pandas(self_destruct=True, split_blocks=True))
 
     def get_play_tracking(
         self,
         game_id: int,
         play_id: int,
-        week: Optional[int] = None
+        week: Optional[int] = None,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Get tracking data for a specific play.
@@ -93,23 +370,33 @@ class NFLDataLoader:
             game_id: Game identifier
             play_id: Play identifier
             week: Week number (if known, for faster loading)
+            columns: Columns to read (default: all), e.g. TRACKING_MIN_COLS
 
         Returns:
             DataFrame with tracking data for the play
         """
-        if week is not None:
-            tracking = self.load_tracking_week(week)
-        else:
+        if week is None:
             # Find which week this game is in
-            game_week = self.games[self.games['gameId'] == game_id]['week'].iloc[0]
-            tracking = self.load_tracking_week(game_week)
+            week = self.game_weeks[game_id]
+        week = int(week)
 
-        play_tracking = tracking[
-            (tracking['gameId'] == game_id) &
-            (tracking['playId'] == play_id)
-        ].copy()
+        with self._tracking_cache_lock:
+            tracking = self._tracking_cache.get(week)
+            if tracking is not None:
+                self._tracking_cache.move_to_end(week)
 
-        return play_tracking
+        if tracking is not None:
+            mask = (tracking['gameId'] == game_id) & (tracking['playId'] == play_id)
+            return tracking.loc[mask] if columns is None else tracking.loc[mask, columns]
+
+        # Push the play filter down to the Parquet reader so only the row
+        # groups containing this play are decoded
+        table = ds.dataset(self._tracking_parquet_path(week)).to_table(
+            columns=columns,
+            filter=(pc.field('gameId') == game_id) & (pc.field('playId') == play_id)
+        )
+
+        return _categorize(table.to_pandas())
 
     def get_pass_plays(
         self,
@@ -130,21 +417,24 @@ class NFLDataLoader:
         Returns:
             Filtered DataFrame of plays
         """
-        plays = self.plays[self.plays['isDropback'] == True].copy()
+        plays = self.plays
+
+        # Combine all criteria into one mask and materialize the result once
+        mask = (plays['isDropback'] == True).to_numpy(copy=True)
 
         if min_air_yards is not None:
-            plays = plays[plays['passLength'] >= min_air_yards]
+            mask &= (plays['passLength'] >= min_air_yards).to_numpy()
 
         if max_air_yards is not None:
-            plays = plays[plays['passLength'] <= max_air_yards]
+            mask &= (plays['passLength'] <= max_air_yards).to_numpy()
 
         if pass_result is not None:
-            plays = plays[plays['passResult'].isin(pass_result)]
+            mask &= plays['passResult'].isin(pass_result).to_numpy()
 
         if coverage_type is not None:
-            plays = plays[plays['pff_passCoverage'].isin(coverage_type)]
+            mask &= plays['pff_passCoverage'].isin(coverage_type).to_numpy()
 
-        return plays
+        return plays.loc[mask]
 
     def get_play_metadata(self, game_id: int, play_id: int) -> dict:
         """
@@ -157,12 +447,8 @@ class NFLDataLoader:
         Returns:
             Dictionary with play metadata
         """
-        play = self.plays[
-            (self.plays['gameId'] == game_id) &
-            (self.plays['playId'] == play_id)
-        ].iloc[0]
-
-        game = self.games[self.games['gameId'] == game_id].iloc[0]
+        play = self.plays_by_id.loc[(game_id, play_id)]
+        game = self.games_by_id.loc[game_id]
 
         return {
             'game_id': game_id,
@@ -183,51 +469,140 @@ class NFLDataLoader:
         }
 
 
+def encode_events(events: pd.Series) -> Tuple[np.ndarray, int, np.ndarray]:
+    """
+    Encode tracking events as categorical codes for the bounds kernels.
+
+    Args:
+        events: Tracking event column
+
+    Returns:
+        Tuple of (per-row codes with -1 for no event, pass_forward code
+        or -2 when absent, boolean outcome mask indexed by code; its last
+        entry is False so that code -1 also indexes safely)
+    """
+    if not isinstance(events.dtype, pd.CategoricalDtype):
+        events = events.astype('category')
+
+    categories = events.cat.categories
+    codes = events.cat.codes.to_numpy()
+    pass_forward_code = categories.get_loc('pass_forward') if 'pass_forward' in categories else -2
+    outcome_mask = np.append(categories.isin(OUTCOME_EVENTS), False)
+
+    return codes, pass_forward_code, outcome_mask
+
+
+def _find_bounds_numpy(codes, frame_ids, pass_forward_code, outcome_mask):
+    """NumPy implementation of find_ball_in_air_bounds."""
+    pass_forward_idx = np.flatnonzero(codes == pass_forward_code)
+    outcome_idx = np.flatnonzero(outcome_mask[codes])
+
+    if pass_forward_idx.size == 0 or outcome_idx.size == 0:
+        return -1, -1
+
+    start = np.searchsorted(frame_ids, frame_ids[pass_forward_idx[0]], side='left')
+    end = np.searchsorted(frame_ids, frame_ids[outcome_idx[0]], side='right')
+    return start, end
+
+
+def _find_bounds_loop(codes, frame_ids, pass_forward_code, outcome_mask):
+    """Single-pass loop implementation of find_ball_in_air_bounds (JIT target)."""
+    pass_forward_frame = -1
+    outcome_frame = -1
+
+    for i in range(codes.shape[0]):
+        code = codes[i]
+        if code < 0:
+            continue
+        if pass_forward_frame < 0 and code == pass_forward_code:
+            pass_forward_frame = frame_ids[i]
+        if outcome_frame < 0 and outcome_mask[code]:
+            outcome_frame = frame_ids[i]
+        if pass_forward_frame >= 0 and outcome_frame >= 0:
+            break
+
+    if pass_forward_frame < 0 or outcome_frame < 0:
+        return -1, -1
+
+    start = np.searchsorted(frame_ids, pass_forward_frame, side='left')
+    end = np.searchsorted(frame_ids, outcome_frame, side='right')
+    return start, end
+
+
+def _find_bounds_batch(codes, frame_ids, offsets, pass_forward_code, outcome_mask):
+    """Apply find_ball_in_air_bounds to each play segment (JIT target)."""
+    n_plays = offsets.shape[0] - 1
+    bounds = np.full((n_plays, 2), -1, dtype=np.int64)
+
+    for p in prange(n_plays):
+        lo = offsets[p]
+        hi = offsets[p + 1]
+        start, end = find_ball_in_air_bounds(
+            codes[lo:hi], frame_ids[lo:hi], pass_forward_code, outcome_mask
+        )
+        if start >= 0:
+            bounds[p, 0] = lo + start
+            bounds[p, 1] = lo + end
+
+    return bounds
+
+
+# find_ball_in_air_bounds(codes, frame_ids, pass_forward_code, outcome_mask)
+#   Row range [start, end) of the ball-in-air window in frame-sorted rows of
+#   one play, or (-1, -1) when either marker event is missing.
+# find_ball_in_air_bounds_batch(codes, frame_ids, offsets, pass_forward_code, outcome_mask)
+#   Same for many plays stored back to back, play p spanning rows
+#   offsets[p]:offsets[p + 1]; returns an (n_plays, 2) array of absolute rows.
+if NUMBA_AVAILABLE:
+    find_ball_in_air_bounds = njit(cache=True)(_find_bounds_loop)
+    find_ball_in_air_bounds_batch = njit(cache=True, parallel=True)(_find_bounds_batch)
+else:
+    find_ball_in_air_bounds = _find_bounds_numpy
+    find_ball_in_air_bounds_batch = _find_bounds_batch
+
+
 def extract_ball_in_air_frames(tracking: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
     """
     Extract only the frames where the ball is in the air.
 
+    The filtered frame is a slice of the input, not a copy; call .copy()
+    on it before modifying.
+
     Args:
         tracking: Full tracking data for a play
 
     Returns:
         Tuple of (filtered tracking data, info dict with frame indices)
     """
-    # Find pass_forward event
-    pass_forward_frame = tracking[
-        tracking['event'] == 'pass_forward'
-    ]['frameId'].min()
-
-    # Find pass arrival/outcome events
-    outcome_events = [
-        'pass_arrived',
-        'pass_outcome_caught',
-        'pass_outcome_incomplete',
-        'pass_outcome_interception'
-    ]
-
-    outcome_frame = tracking[
-        tracking['event'].isin(outcome_events)
-    ]['frameId'].min()
+    if not tracking['frameId'].is_monotonic_increasing:
+        tracking = tracking.sort_values('frameId', kind='stable')
+
+    frame_ids = tracking['frameId'].to_numpy()
+    codes, pass_forward_code, outcome_mask = encode_events(tracking['event'])
+
+    start, end = find_ball_in_air_bounds(codes, frame_ids, pass_forward_code, outcome_mask)
 
     # If we couldn't find clear markers, return full play
-    if pd.isna(pass_forward_frame) or pd.isna(outcome_frame):
+    if start < 0:
         return tracking, {
             'pass_forward_frame': None,
             'outcome_frame': None,
-            'frames_in_air': len(tracking['frameId'].unique())
+            'frames_in_air': int(np.unique(frame_ids).size)
         }
 
-    # Filter to ball-in-air frames
-    ball_in_air = tracking[
-        (tracking['frameId'] >= pass_forward_frame) &
-        (tracking['frameId'] <= outcome_frame)
-    ].copy()
+    pass_forward_frame = frame_ids[start]
+    outcome_frame = frame_ids[end - 1]
+
+    # Filter to ball-in-air frames with a single positional slice
+    ball_in_air = tracking.iloc[start:end]
+
+    air_frame_ids = frame_ids[start:end]
+    frames_in_air = int(np.count_nonzero(np.diff(air_frame_ids)) + 1) if air_frame_ids.size else 0
 
     info = {
         'pass_forward_frame': pass_forward_frame,
         'outcome_frame': outcome_frame,
-        'frames_in_air': len(ball_in_air['frameId'].unique()),
+        'frames_in_air': frames_in_air,
         'time_in_air': (outcome_frame - pass_forward_frame) / 10.0  # 10 Hz
     }
 
@@ -3,19 +3,236 @@ Intelligent play recommendation system for YouTube overlay visualization.
 Analyzes tracking data to find compelling plays with YouTube footage availability.
 """
 
+import re
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from data.loader import NFLDataLoader, extract_ball_in_air_frames
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+TOUCHDOWN_RE = re.compile(r'touchdown', re.IGNORECASE)
+
+# Descriptions read "... QB pass [direction] to RECEIVER ...": QB is the last
+# word before the first " pass ", receiver the first word after the first " to "
+QB_NAME_RE = re.compile(r'(?P<qb_name>\S+)\s* pass ')
+RECEIVER_NAME_RE = re.compile(r' to \s*(?P<receiver_name>\S+)')
+
+# Weights for the total visualization score (weighted average of components)
+SCORE_WEIGHTS = {
+    'air_yards': 0.25,      # Most important for visualization
+    'result': 0.20,         # Completions/INTs more likely on YouTube
+    'importance': 0.15,
+    'situation': 0.15,
+    'down_distance': 0.15,
+    'quarter': 0.10
+}
+
+# Component order used by the scoring kernels
+SCORE_COMPONENTS = ('air_yards', 'result', 'importance', 'situation', 'down_distance', 'quarter')
+_SCORE_WEIGHT_VALUES = np.array([SCORE_WEIGHTS[k] for k in SCORE_COMPONENTS])
+
+# YouTube likelihood buckets: total_score < 6.0 is LOW, < 7.5 MEDIUM, else HIGH
+YOUTUBE_LIKELIHOOD_LEVELS = ['LOW', 'MEDIUM', 'HIGH']
+YOUTUBE_LIKELIHOOD_EDGES = np.array([6.0, 7.5])
+
+# passResult encoding passed to the scoring kernels
+RESULT_OTHER, RESULT_COMPLETE, RESULT_INTERCEPTION = 0, 1, 2
+
+
+def touchdown_mask(descriptions: pd.Series) -> np.ndarray:
+    """
+    Flag play descriptions that mention a touchdown.
+
+    Args:
+        descriptions: playDescription values (missing values count as False)
+
+    Returns:
+        Boolean array aligned with descriptions
+    """
+    # Plain case-insensitive substring search; no regex engine needed
+    return descriptions.str.contains(
+        'touchdown', case=False, regex=False, na=False
+    ).to_numpy(dtype=bool)
+
+
+def extract_pass_names(descriptions: pd.Series) -> pd.DataFrame:
+    """
+    Pull QB and receiver names out of play descriptions.
+
+    Args:
+        descriptions: playDescription values
+
+    Returns:
+        DataFrame aligned with descriptions with qb_name and receiver_name
+        columns (NaN unless the description has both " pass " and " to ")
+    """
+    desc = descriptions.fillna('').astype(str)
+    has_names = (
+        desc.str.contains(' pass ', regex=False) &
+        desc.str.contains(' to ', regex=False)
+    )
+    names = pd.concat(
+        [desc.str.extract(QB_NAME_RE), desc.str.extract(RECEIVER_NAME_RE)],
+        axis=1
+    )
+    return names.where(has_names)
+
+
+def _score_play(air_yards, is_td, result_code, week, score_diff, down, yards_to_go, quarter):
+    """Component scores and weighted total for one play (JIT target)."""
+    # 1. Air Yards Score (longer = more time in air = better visualization)
+    if air_yards != air_yards:  # NaN
+        air_yards_score = 0.0
+    elif air_yards >= 40:
+        air_yards_score = 10.0
+    elif air_yards >= 25:
+        air_yards_score = 8.0
+    elif air_yards >= 15:
+        air_yards_score = 5.0
+    else:
+        air_yards_score = 2.0
+
+    # 2. Play Result Score (completions and INTs more interesting than incompletions)
+    if result_code == RESULT_COMPLETE:
+        result_score = 10.0 if is_td else 7.0  # TDs almost always on YouTube
+    elif result_code == RESULT_INTERCEPTION:
+        result_score = 9.0  # Interceptions are highlight-worthy
+    else:
+        result_score = 3.0  # Incompletions less likely on YouTube
+
+    # 3. Game Importance Score
+    if week >= 15:  # Playoff push
+        importance_score = 8.0
+    elif week >= 10:
+        importance_score = 6.0
+    else:
+        importance_score = 5.0
+
+    # 4. Score Situation (close games more likely featured)
+    if score_diff <= 7:
+        situation_score = 8.0  # One score game
+    elif score_diff <= 14:
+        situation_score = 6.0
+    else:
+        situation_score = 4.0
+
+    # 5. Down & Distance (clutch situations)
+    if down == 3 or down == 4:
+        down_distance_score = 8.0 if yards_to_go >= 7 else 6.0  # 3rd/4th and long
+    else:
+        down_distance_score = 5.0
+
+    # 6. Quarter (late game more dramatic)
+    if quarter == 4:
+        quarter_score = 8.0
+    elif quarter == 3:
+        quarter_score = 6.0
+    else:
+        quarter_score = 5.0
+
+    total_score = (
+        0.0 +
+        air_yards_score * _SCORE_WEIGHT_VALUES[0] +
+        result_score * _SCORE_WEIGHT_VALUES[1] +
+        importance_score * _SCORE_WEIGHT_VALUES[2] +
+        situation_score * _SCORE_WEIGHT_VALUES[3] +
+        down_distance_score * _SCORE_WEIGHT_VALUES[4] +
+        quarter_score * _SCORE_WEIGHT_VALUES[5]
+    )
+
+    return (
+        air_yards_score, result_score, importance_score,
+        situation_score, down_distance_score, quarter_score, total_score
+    )
+
+
+def _score_plays_loop(air_yards, is_td, result_code, week, score_diff, down, yards_to_go, quarter):
+    """Apply _score_kernel to every play (JIT target)."""
+    n_plays = air_yards.shape[0]
+    scores = np.empty((n_plays, len(SCORE_COMPONENTS) + 1))
+
+    for i in prange(n_plays):
+        row = _score_kernel(
+            air_yards[i], is_td[i], result_code[i], week[i],
+            score_diff[i], down[i], yards_to_go[i], quarter[i]
+        )
+        for j in range(len(row)):
+            scores[i, j] = row[j]
+
+    return scores
+
+
+def _score_plays_numpy(air_yards, is_td, result_code, week, score_diff, down, yards_to_go, quarter):
+    """NumPy implementation of _score_kernel_array."""
+    complete = result_code == RESULT_COMPLETE
+    late_down = (down == 3) | (down == 4)
+
+    components = [
+        np.where(
+            np.isnan(air_yards),
+            0,
+            np.select([air_yards >= 40, air_yards >= 25, air_yards >= 15], [10, 8, 5], default=2)
+        ),
+        np.select(
+            [complete & is_td, complete, result_code == RESULT_INTERCEPTION],
+            [10, 7, 9],
+            default=3
+        ),
+        np.select([week >= 15, week >= 10], [8, 6], default=5),
+        np.select([score_diff <= 7, score_diff <= 14], [8, 6], default=4),
+        np.select([late_down & (yards_to_go >= 7), late_down], [8, 6], default=5),
+        np.select([quarter == 4, quarter == 3], [8, 6], default=5),
+    ]
+
+    total_score = 0.0
+    for component, weight in zip(components, _SCORE_WEIGHT_VALUES):
+        total_score = total_score + component * weight
+
+    return np.column_stack(components + [total_score]).astype(np.float64)
+
+
+# _score_kernel(air_yards, is_td, result_code, week, score_diff, down, yards_to_go, quarter)
+#   Tuple of the six component scores (SCORE_COMPONENTS order) and the
+#   weighted total for one play; air_yards is NaN when passLength is missing.
+# _score_kernel_array(...)
+#   Same for arrays of plays; returns an (n_plays, 7) float64 array.
+if NUMBA_AVAILABLE:
+    _score_kernel = njit(cache=True)(_score_play)
+    _score_kernel_array = njit(cache=True, parallel=True)(_score_plays_loop)
+else:
+    _score_kernel = _score_play
+    _score_kernel_array = _score_plays_numpy
+
 
 class PlayRecommender:
     """Recommend compelling plays for YouTube overlay visualization."""
 
+    # Plays columns carried through scoring, the report and the CSV export
+    _SCORING_COLS = (
+        'gameId', 'playId', 'week', 'quarter', 'down', 'yardsToGo',
+        'yardlineSide', 'yardlineNumber', 'possessionTeam', 'defensiveTeam',
+        'preSnapHomeScore', 'preSnapVisitorScore', 'passLength', 'passResult',
+        'pff_passCoverage', 'playDescription'
+    )
+
+    # Game columns attached to the scored inventory
+    _GAME_COLS = ('season', 'gameDate', 'homeTeamAbbr', 'visitorTeamAbbr')
+
+    # Scored inventories kept in memory (least recently used dropped first)
+    _SCORED_CACHE_SIZE = 4
+
     def __init__(self, loader: NFLDataLoader):
         """
         Initialize recommender.
@@ -25,6 +242,13 @@ class PlayRecommender:
         """
         self.loader = loader
 
+        # Scored inventories keyed by plays table identity and filters
+        self._scored_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+
+    def clear_cache(self):
+        """Drop the memoized play inventory (call after mutating loader.plays)."""
+        self._scored_cache.clear()
+
     def score_play_for_youtube(self, play_row: pd.Series) -> Dict[str, float]:
         """
         Score a play's suitability for YouTube overlay visualization.
@@ -35,94 +259,89 @@ class PlayRecommender:
         Returns:
             Dictionary of scores and reasons
         """
-        scores = {}
-
-        # 1. Air Yards Score (longer = more time in air = better visualization)
-        air_yards = play_row.get('passLength', 0)
-        if pd.notna(air_yards):
-            if air_yards >= 40:
-                scores['air_yards'] = 10
-            elif air_yards >= 25:
-                scores['air_yards'] = 8
-            elif air_yards >= 15:
-                scores['air_yards'] = 5
-            else:
-                scores['air_yards'] = 2
-        else:
-            scores['air_yards'] = 0
+        def value(name, default):
+            raw = play_row.get(name, default)
+            return np.nan if pd.isna(raw) else float(raw)
 
-        # 2. Play Result Score (completions and INTs more interesting than incompletions)
         result = play_row.get('passResult', '')
         if result == 'C':
-            # Check if touchdown
-            desc = str(play_row.get('playDescription', '')).upper()
-            if 'TOUCHDOWN' in desc:
-                scores['result'] = 10  # TDs almost always on YouTube
-            else:
-                scores['result'] = 7
+            result_code = RESULT_COMPLETE
         elif result == 'IN':
-            scores['result'] = 9  # Interceptions are highlight-worthy
+            result_code = RESULT_INTERCEPTION
         else:
-            scores['result'] = 3  # Incompletions less likely on YouTube
-
-        # 3. Game Importance Score
-        week = play_row.get('week', 0)
-        if week >= 15:  # Playoff push
-            scores['importance'] = 8
-        elif week >= 10:
-            scores['importance'] = 6
-        else:
-            scores['importance'] = 5
-
-        # 4. Score Situation (close games more likely featured)
-        home_score = play_row.get('preSnapHomeScore', 0)
-        visitor_score = play_row.get('preSnapVisitorScore', 0)
-        score_diff = abs(home_score - visitor_score)
+            result_code = RESULT_OTHER
+
+        desc = play_row.get('playDescription', '')
+        is_td = isinstance(desc, str) and TOUCHDOWN_RE.search(desc) is not None
+
+        row = _score_kernel(
+            value('passLength', 0),
+            is_td,
+            result_code,
+            value('week', 0),
+            abs(value('preSnapHomeScore', 0) - value('preSnapVisitorScore', 0)),
+            value('down', 0),
+            value('yardsToGo', 0),
+            value('quarter', 1)
+        )
 
-        if score_diff <= 7:
-            scores['situation'] = 8  # One score game
-        elif score_diff <= 14:
-            scores['situation'] = 6
-        else:
-            scores['situation'] = 4
-
-        # 5. Down & Distance (clutch situations)
-        down = play_row.get('down', 0)
-        yards_to_go = play_row.get('yardsToGo', 0)
-
-        if down == 3 or down == 4:
-            if yards_to_go >= 7:
-                scores['down_distance'] = 8  # 3rd/4th and long
-            else:
-                scores['down_distance'] = 6
-        else:
-            scores['down_distance'] = 5
-
-        # 6. Quarter (late game more dramatic)
-        quarter = play_row.get('quarter', 1)
-        if quarter == 4:
-            scores['quarter'] = 8
-        elif quarter == 3:
-            scores['quarter'] = 6
-        else:
-            scores['quarter'] = 5
-
-        # Total score (weighted average)
-        weights = {
-            'air_yards': 0.25,      # Most important for visualization
-            'result': 0.20,         # Completions/INTs more likely on YouTube
-            'importance': 0.15,
-            'situation': 0.15,
-            'down_distance': 0.15,
-            'quarter': 0.10
+        return {
+            'total_score': row[-1],
+            'breakdown': dict(zip(SCORE_COMPONENTS, row[:-1]))
         }
 
-        total_score = sum(scores[k] * weights[k] for k in scores.keys())
+    def score_plays_for_youtube(self, plays: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many plays at once; column-wise equivalent of score_play_for_youtube.
 
-        return {
+        Args:
+            plays: Rows from plays DataFrame
+
+        Returns:
+            DataFrame aligned with plays holding one column per score component,
+            plus total_score, youtube_likelihood and the is_touchdown flag
+        """
+        def column(name, default):
+            # Keep the narrow read-time dtypes; only nullable extension
+            # columns are widened to float so missing values become NaN
+            if name not in plays.columns:
+                return np.full(len(plays), default, dtype=np.int8)
+            values = plays[name]
+            if isinstance(values.dtype, np.dtype):
+                return values.to_numpy()
+            return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # passResult is categorical, so these compare integer codes
+        result_code = np.select(
+            [plays['passResult'].eq('C').to_numpy(), plays['passResult'].eq('IN').to_numpy()],
+            [RESULT_COMPLETE, RESULT_INTERCEPTION],
+            default=RESULT_OTHER
+        ).astype(np.int8)
+        is_td = touchdown_mask(plays['playDescription'])
+
+        scores = _score_kernel_array(
+            column('passLength', 0).astype(np.float64),
+            is_td,
+            result_code,
+            column('week', 0),
+            np.abs(column('preSnapHomeScore', 0) - column('preSnapVisitorScore', 0)),
+            column('down', 0),
+            column('yardsToGo', 0),
+            column('quarter', 1)
+        )
+        total_score = scores[:, -1]
+
+        return pd.DataFrame({
+            'gameId': plays['gameId'].to_numpy(),
+            'playId': plays['playId'].to_numpy(),
             'total_score': total_score,
-            'breakdown': scores
-        }
+            'is_touchdown': is_td,
+            'youtube_likelihood': pd.Categorical.from_codes(
+                np.searchsorted(YOUTUBE_LIKELIHOOD_EDGES, total_score, side='right'),
+                YOUTUBE_LIKELIHOOD_LEVELS
+            ),
+            **{name: scores[:, i] for i, name in enumerate(SCORE_COMPONENTS)}
+        }, index=plays.index)
 
     def get_youtube_search_quality(self, play_row: pd.Series) -> str:
         """
@@ -144,44 +363,88 @@ class PlayRecommender:
         else:
             return 'LOW'
 
-    def analyze_play_inventory(self) -> pd.DataFrame:
+    def analyze_play_inventory(
+        self,
+        force_refresh: bool = False,
+        min_air_yards: Optional[float] = None,
+        youtube_quality: Optional[str] = None,
+        top_k: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Analyze all pass plays and score them.
 
+        Filters are applied as early as possible: air yards before scoring,
+        likelihood before sorting. The result is memoized per filter
+        combination; later calls return the cached DataFrame unless the
+        loader's plays table has been replaced or force_refresh is set.
+
+        Args:
+            force_refresh: Re-score even if a cached inventory is available
+            min_air_yards: Only keep plays with at least this passLength
+            youtube_quality: Only keep plays with this likelihood ('HIGH',
+                             'MEDIUM' or 'LOW')
+            top_k: Only return the top_k highest-scoring plays (partial
+                   selection instead of a full sort)
+
         Returns:
-            DataFrame with plays and scores
+            DataFrame with plays and scores, sorted by total_score descending
         """
-        # Get all pass plays
-        pass_plays = self.loader.plays[
-            (self.loader.plays['isDropback'] == True) &
-            (self.loader.plays['passResult'].isin(['C', 'I', 'IN']))
-        ].copy()
+        plays = self.loader.plays
+        cache_key = (id(plays), len(plays), min_air_yards, youtube_quality, top_k)
+        if not force_refresh and cache_key in self._scored_cache:
+            self._scored_cache.move_to_end(cache_key)
+            return self._scored_cache[cache_key]
+
+        # Get all pass plays (one combined mask; categorical isin matches codes)
+        mask = (
+            plays['isDropback'].eq(True).to_numpy() &
+            plays['passResult'].isin(['C', 'I', 'IN']).to_numpy()
+        )
+        if min_air_yards is not None:
+            mask &= plays['passLength'].ge(min_air_yards).to_numpy()
+        # Keep only the columns used downstream, and attach game info once
+        columns = [c for c in self._SCORING_COLS if c in plays.columns]
+        game_columns = [c for c in self._GAME_COLS if c not in columns]
+        pass_plays = plays.loc[mask, columns].join(
+            self.loader.games_by_id[game_columns], on='gameId'
+        )
 
         print(f"Analyzing {len(pass_plays)} pass plays...")
 
-        # Score each play
-        scores = []
-        for idx, play in pass_plays.iterrows():
-            score_info = self.score_play_for_youtube(play)
-            scores.append({
-                'gameId': play['gameId'],
-                'playId': play['playId'],
-                'total_score': score_info['total_score'],
-                'youtube_likelihood': self.get_youtube_search_quality(play),
-                **score_info['breakdown']
-            })
-
-        scores_df = pd.DataFrame(scores)
-
-        # Merge with play data
-        result = pass_plays.merge(scores_df, on=['gameId', 'playId'])
-
-        # Sort by score
-        result = result.sort_values('total_score', ascending=False)
+        # Score all plays in one vectorized pass
+        scores_df = self.score_plays_for_youtube(pass_plays)
+
+        # Diagnostics describe the whole scored inventory, before filtering
+        likelihood = scores_df['youtube_likelihood']
+        print(f"Scored {len(scores_df)} plays")
+        print(f"HIGH YouTube likelihood: {int(likelihood.eq('HIGH').sum())}")
+        print(f"MEDIUM YouTube likelihood: {int(likelihood.eq('MEDIUM').sum())}")
+
+        if youtube_quality is not None:
+            keep = scores_df['youtube_likelihood'].eq(youtube_quality).to_numpy()
+            pass_plays = pass_plays.loc[keep]
+            scores_df = scores_df.loc[keep]
+
+        # Parse names once so the report and query builders reuse them
+        scores_df = scores_df.join(extract_pass_names(pass_plays['playDescription']))
+
+        # Attach scores by index (both frames share pass_plays' index); the
+        # quarter score must not shadow the quarter column
+        result = pass_plays.join(
+            scores_df.drop(columns=['gameId', 'playId']), rsuffix='_score'
+        )
+
+        # Sort by score (stable, so ties keep plays-table order whatever the
+        # filters); callers that want only the best few skip the full sort
+        if top_k is not None:
+            result = result.nlargest(top_k, 'total_score', keep='first')
+        else:
+            result = result.sort_values('total_score', ascending=False, kind='stable')
 
-        print(f"Scored {len(result)} plays")
-        print(f"HIGH YouTube likelihood: {len(result[result['youtube_likelihood'] == 'HIGH'])}")
-        print(f"MEDIUM YouTube likelihood: {len(result[result['youtube_likelihood'] == 'MEDIUM'])}")
+        self._scored_cache[cache_key] = result
+        self._scored_cache.move_to_end(cache_key)
+        while len(self._scored_cache) > self._SCORED_CACHE_SIZE:
+            self._scored_cache.popitem(last=False)
 
         return result
 
@@ -202,19 +465,12 @@ class PlayRecommender:
         Returns:
             DataFrame with top recommendations
         """
-        # Analyze inventory
-        scored_plays = self.analyze_play_inventory()
-
-        # Filter
-        filtered = scored_plays[
-            (scored_plays['passLength'] >= min_air_yards) &
-            (scored_plays['youtube_likelihood'] == youtube_quality)
-        ]
-
-        # Get top N
-        top_plays = filtered.head(n)
-
-        return top_plays
+        # Analyze inventory (filtered, top N selected)
+        return self.analyze_play_inventory(
+            min_air_yards=min_air_yards,
+            youtube_quality=youtube_quality,
+            top_k=n
+        )
 
     def generate_youtube_query(self, play_row: pd.Series) -> str:
         """
@@ -226,71 +482,64 @@ class PlayRecommender:
         Returns:
             YouTube search query string
         """
-        # Get game info
-        game = self.loader.games[
-            self.loader.games['gameId'] == play_row['gameId']
-        ].iloc[0]
-
-        # Get teams
-        home_team = game['homeTeamAbbr']
-        away_team = game['visitorTeamAbbr']
-        possession = play_row['possessionTeam']
-        defense = play_row['defensiveTeam']
-
-        # Get play details
-        desc = str(play_row['playDescription'])
-        yards = int(play_row['passLength']) if pd.notna(play_row['passLength']) else 0
-
-        # Extract QB and receiver from description
-        # Format is usually "QB pass [direction] to RECEIVER"
-        qb_name = "QB"
-        receiver_name = "receiver"
-
-        if " pass " in desc and " to " in desc:
-            parts = desc.split(" pass ")
-            if len(parts) > 0:
-                qb_part = parts[0].strip().split()
-                if qb_part:
-                    qb_name = qb_part[-1]  # Last word before "pass"
-
-            parts = desc.split(" to ")
-            if len(parts) > 1:
-                receiver_part = parts[1].strip().split()
-                if receiver_part:
-                    receiver_name = receiver_part[0]  # First word after "to"
-
-        # Build query
-        query_parts = []
-
-        # Add player names if extracted
-        if qb_name != "QB":
-            query_parts.append(qb_name)
-
-        if receiver_name != "receiver":
-            query_parts.append(receiver_name)
+        return self.build_youtube_queries(play_row.to_frame().T).iloc[0]
 
-        # Add yards if significant
-        if yards >= 20:
-            query_parts.append(f"{yards} yards")
-
-        # Add teams
-        query_parts.append(possession)
-        query_parts.append("vs")
-        query_parts.append(defense)
-
-        # Add year
-        season = game.get('season', 2023)
-        query_parts.append(str(season))
-
-        # Add result type
-        if play_row['passResult'] == 'IN':
-            query_parts.append("interception")
-        elif 'TOUCHDOWN' in desc.upper():
-            query_parts.append("touchdown")
+    def build_youtube_queries(self, plays: pd.DataFrame) -> pd.Series:
+        """
+        Generate YouTube search queries for many plays at once.
+
+        Queries are "[QB] [receiver] [N yards] TEAM vs TEAM SEASON RESULT",
+        assembled with vectorized string operations.
+
+        Args:
+            plays: Rows from plays DataFrame
+
+        Returns:
+            Series of query strings aligned with plays
+        """
+        # Reuse names and touchdown flags precomputed by analyze_play_inventory
+        if {'qb_name', 'receiver_name'}.issubset(plays.columns):
+            names = plays[['qb_name', 'receiver_name']]
+        else:
+            names = extract_pass_names(plays['playDescription'])
+        if 'is_touchdown' in plays.columns:
+            is_td = plays['is_touchdown'].to_numpy(dtype=bool)
         else:
-            query_parts.append("highlights")
+            is_td = touchdown_mask(plays['playDescription'])
 
-        return " ".join(query_parts)
+        # Add yards if significant
+        yards = plays['passLength'].fillna(0).astype(int)
+        yards_part = pd.Series(
+            np.where(yards >= 20, yards.astype(str) + ' yards ', ''),
+            index=plays.index
+        )
+
+        # Season from the scored inventory, else via the indexed games table
+        if 'season' in plays.columns:
+            season = plays['season']
+        else:
+            season = plays['gameId'].map(self.loader.games_by_id['season'])
+        season = season.fillna(2023)
+
+        # Result type
+        result_part = pd.Series(
+            np.select(
+                [plays['passResult'].eq('IN').to_numpy(), is_td],
+                ['interception', 'touchdown'],
+                default='highlights'
+            ),
+            index=plays.index
+        )
+
+        return (
+            (names['qb_name'] + ' ').fillna('') +
+            (names['receiver_name'] + ' ').fillna('') +
+            yards_part +
+            plays['possessionTeam'].astype(str) + ' vs ' +
+            plays['defensiveTeam'].astype(str) + ' ' +
+            season.astype(int).astype(str) + ' ' +
+            result_part
+        )
 
     def create_recommendation_report(
         self,
@@ -308,7 +557,24 @@ class PlayRecommender:
         # Get top recommendations
         top_20 = self.get_top_recommendations(n=20, min_air_yards=20, youtube_quality='HIGH')
 
-        # Build markdown report
+        # Stream the report section by section through a large write buffer
+        with open(output_path, 'w', buffering=1 << 20) as f:
+            f.writelines(self._report_sections(top_20))
+
+        print(f"Recommendation report saved to: {output_path}")
+
+        return output_path
+
+    def _report_sections(self, top_20: pd.DataFrame):
+        """
+        Yield the markdown report as newline-terminated text chunks.
+
+        Args:
+            top_20: Recommended plays from get_top_recommendations
+
+        Yields:
+            The header, one chunk per play, then the summary statistics
+        """
         lines = []
         lines.append("# Recommended Plays for YouTube Overlay Visualization")
         lines.append("")
@@ -323,54 +589,59 @@ class PlayRecommender:
         lines.append("- **Quarter** (10%): 4th quarter most exciting")
         lines.append("")
         lines.append(f"**Total Plays Analyzed:** {len(self.loader.plays)}")
-        lines.append(f"**Pass Plays:** {len(self.loader.plays[self.loader.plays['isDropback'] == True])}")
+        lines.append(f"**Pass Plays:** {int(self.loader.plays['isDropback'].eq(True).sum())}")
         lines.append(f"**High YouTube Likelihood:** {len(top_20)}")
         lines.append("")
         lines.append("---")
         lines.append("")
         lines.append("## Top 20 Recommended Plays")
         lines.append("")
-
-        for idx, (_, play) in enumerate(top_20.iterrows(), 1):
-            game = self.loader.games[
-                self.loader.games['gameId'] == play['gameId']
-            ].iloc[0]
-
-            lines.append(f"### Play #{idx}: {play['possessionTeam']} vs {play['defensiveTeam']}")
+        yield "\n".join(lines) + "\n"
+
+        # Precompute per-play values so the loop below only formats
+        report_plays = top_20.assign(
+            score_diff=(top_20['preSnapHomeScore'] - top_20['preSnapVisitorScore']).abs(),
+            youtube_query=self.build_youtube_queries(top_20)
+        )
+        if 'pff_passCoverage' not in report_plays.columns:
+            report_plays['pff_passCoverage'] = None
+
+        for idx, play in enumerate(report_plays.itertuples(index=False), 1):
+            lines = []
+            lines.append(f"### Play #{idx}: {play.possessionTeam} vs {play.defensiveTeam}")
             lines.append("")
 
             # Game info
-            lines.append(f"**Game:** Week {play['week']}, {game['gameDate']}")
-            lines.append(f"**Teams:** {game['homeTeamAbbr']} vs {game['visitorTeamAbbr']}")
-            lines.append(f"**Score:** {play['preSnapHomeScore']}-{play['preSnapVisitorScore']}")
+            lines.append(f"**Game:** Week {play.week}, {play.gameDate}")
+            lines.append(f"**Teams:** {play.homeTeamAbbr} vs {play.visitorTeamAbbr}")
+            lines.append(f"**Score:** {play.preSnapHomeScore}-{play.preSnapVisitorScore}")
             lines.append("")
 
             # Play details
-            lines.append(f"**Situation:** Q{play['quarter']}, {play['down']}")
-            if play['down'] in [1, 2, 3, 4]:
-                down_text = {1: '1st', 2: '2nd', 3: '3rd', 4: '4th'}[play['down']]
-                lines.append(f" & {play['yardsToGo']} at {play['yardlineSide']} {play['yardlineNumber']}")
+            lines.append(f"**Situation:** Q{play.quarter}, {play.down}")
+            if play.down in [1, 2, 3, 4]:
+                lines.append(f" & {play.yardsToGo} at {play.yardlineSide} {play.yardlineNumber}")
             lines.append("")
 
             # Play description
-            desc = str(play['playDescription'])[:150]
+            desc = str(play.playDescription)[:150]
             lines.append(f"**Play:** {desc}...")
             lines.append("")
 
             # Key metrics
-            lines.append(f"**Air Yards:** {play['passLength']:.1f}")
-            lines.append(f"**Result:** {play['passResult']}")
-            if pd.notna(play.get('pff_passCoverage')):
-                lines.append(f"**Coverage:** {play['pff_passCoverage']}")
+            lines.append(f"**Air Yards:** {play.passLength:.1f}")
+            lines.append(f"**Result:** {play.passResult}")
+            if pd.notna(play.pff_passCoverage):
+                lines.append(f"**Coverage:** {play.pff_passCoverage}")
             lines.append("")
 
             # Scoring
-            lines.append(f"**Visualization Score:** {play['total_score']:.2f}/10")
-            lines.append(f"**YouTube Likelihood:** {play['youtube_likelihood']}")
+            lines.append(f"**Visualization Score:** {play.total_score:.2f}/10")
+            lines.append(f"**YouTube Likelihood:** {play.youtube_likelihood}")
             lines.append("")
 
             # YouTube search
-            query = self.generate_youtube_query(play)
+            query = play.youtube_query
             lines.append(f"**YouTube Search:**")
             lines.append(f"```")
             lines.append(query)
@@ -386,22 +657,22 @@ class PlayRecommender:
             lines.append(f"**Why This Play:**")
             reasons = []
 
-            if play['passLength'] >= 40:
-                reasons.append(f"- Deep pass ({play['passLength']:.0f} yards) = extended ball-in-air time")
+            if play.passLength >= 40:
+                reasons.append(f"- Deep pass ({play.passLength:.0f} yards) = extended ball-in-air time")
 
-            if 'TOUCHDOWN' in desc.upper():
+            if play.is_touchdown:
                 reasons.append("- Touchdown = guaranteed YouTube highlights")
 
-            if play['passResult'] == 'IN':
+            if play.passResult == 'IN':
                 reasons.append("- Interception = dramatic defensive play")
 
-            if play['down'] >= 3:
-                reasons.append(f"- {play['down']}rd/4th down clutch situation")
+            if play.down >= 3:
+                reasons.append(f"- {play.down}rd/4th down clutch situation")
 
-            if abs(play['preSnapHomeScore'] - play['preSnapVisitorScore']) <= 7:
+            if play.score_diff <= 7:
                 reasons.append("- One-score game = high stakes")
 
-            if play['quarter'] == 4:
+            if play.quarter == 4:
                 reasons.append("- 4th quarter drama")
 
             for reason in reasons:
@@ -410,30 +681,22 @@ class PlayRecommender:
             lines.append("")
 
             # Game/Play IDs for loading
-            lines.append(f"**Data:** `gameId={play['gameId']}`, `playId={play['playId']}`")
+            lines.append(f"**Data:** `gameId={play.gameId}`, `playId={play.playId}`")
             lines.append("")
             lines.append("---")
             lines.append("")
+            yield "\n".join(lines) + "\n"
 
         # Summary stats
+        lines = []
         lines.append("## Summary Statistics")
         lines.append("")
         lines.append(f"- Average Air Yards: {top_20['passLength'].mean():.1f}")
         lines.append(f"- Average Score: {top_20['total_score'].mean():.2f}/10")
-        lines.append(f"- Touchdowns: {len(top_20[top_20['playDescription'].str.contains('TOUCHDOWN', case=False, na=False)])}")
-        lines.append(f"- Interceptions: {len(top_20[top_20['passResult'] == 'IN'])}")
-        lines.append(f"- 4th Quarter: {len(top_20[top_20['quarter'] == 4])}")
-        lines.append("")
-
-        # Write to file
-        output = "\n".join(lines)
-
-        with open(output_path, 'w') as f:
-            f.write(output)
-
-        print(f"Recommendation report saved to: {output_path}")
-
-        return output_path
+        lines.append(f"- Touchdowns: {int(top_20['is_touchdown'].sum())}")
+        lines.append(f"- Interceptions: {int(top_20['passResult'].eq('IN').sum())}")
+        lines.append(f"- 4th Quarter: {int(top_20['quarter'].eq(4).sum())}")
+        yield "\n".join(lines) + "\n"
 
 
 if __name__ == "__main__":
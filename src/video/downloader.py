@@ -4,24 +4,46 @@ YouTube video downloader for NFL play footage.
 
 import subprocess
 import os
+import hashlib
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Callable
 import json
 
+try:
+    from orjson import loads as json_loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # json.loads also accepts UTF-8 bytes
+    from json import loads as json_loads
+    ORJSON_AVAILABLE = False
+
 
 class YouTubeDownloader:
     """Download and manage YouTube video clips of NFL plays."""
 
-    def __init__(self, output_dir: str = "data/videos"):
+    def __init__(
+        self,
+        output_dir: str = "data/videos",
+        info_cache_ttl: float = 7 * 24 * 3600
+    ):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded videos
+            info_cache_ttl: Seconds a cached get_video_info result stays valid
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # On-disk cache of video metadata, one JSON file per URL
+        self._info_cache_dir = self.output_dir / '.info_cache'
+        self.info_cache_ttl = info_cache_ttl
+
     def download_video(
         self,
         url: str,
@@ -70,12 +92,7 @@ class YouTubeDownloader:
 
         # Execute download
         try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            self._run_with_stderr_tail(cmd)
             print(f"Video downloaded successfully: {output_path}")
             return output_path
 
@@ -88,6 +105,81 @@ class YouTubeDownloader:
                 "yt-dlp not found. Install with: pip install yt-dlp"
             )
 
+    def _run_with_stderr_tail(self, cmd: List[str], tail_lines: int = 50):
+        """
+        Run a long subprocess, keeping only the end of its stderr.
+
+        stdout is discarded and stderr is streamed through a bounded deque,
+        so hour-long downloads do not accumulate progress output in memory.
+
+        Args:
+            cmd: Command and arguments
+            tail_lines: Number of trailing stderr lines kept for diagnostics
+
+        Raises:
+            subprocess.CalledProcessError: On non-zero exit, with the stderr
+                tail as its stderr attribute
+        """
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace'
+        ) as proc:
+            tail = deque(proc.stderr, maxlen=tail_lines)
+            returncode = proc.wait()
+
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=''.join(tail))
+
+    def download_many(self, jobs: List[Dict], max_workers: int = 4) -> List[Optional[Path]]:
+        """
+        Download several videos concurrently.
+
+        Args:
+            jobs: One dict of download_video keyword arguments per video,
+                  e.g. {'url': ..., 'output_name': ..., 'start_time': ...}
+            max_workers: Maximum simultaneous yt-dlp processes
+
+        Returns:
+            Downloaded paths in job order (None for failed downloads)
+        """
+        return self._run_parallel(self.download_video, jobs, max_workers)
+
+    def _run_parallel(
+        self,
+        func: Callable,
+        jobs: List[Dict],
+        max_workers: int
+    ) -> List:
+        """
+        Run func(**job) for each job on a thread pool.
+
+        The work is subprocess-bound (yt-dlp/ffmpeg), so threads overlap the
+        waits without contending for the GIL.
+
+        Args:
+            func: Bound method to call
+            jobs: Keyword arguments for each call
+            max_workers: Thread pool size
+
+        Returns:
+            Results in job order (None where the subprocess failed; other
+            errors, such as a missing executable, propagate)
+        """
+        results = [None] * len(jobs)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(func, **job): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except subprocess.CalledProcessError as e:
+                    print(f"Job {futures[future]} failed: {e}")
+
+        return results
+
     def get_video_info(self, url: str) -> Dict:
         """
         Get metadata about a YouTube video.
@@ -98,6 +190,13 @@ class YouTubeDownloader:
         Returns:
             Dictionary with video metadata
         """
+        # Serve repeated lookups from the disk cache
+        key = hashlib.sha1(url.encode()).hexdigest()
+        cache_path = self._info_cache_dir / f"{key}.json"
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < self.info_cache_ttl:
+            with open(cache_path) as f:
+                return json.load(f)
+
         cmd = [
             "yt-dlp",
             "--dump-json",
@@ -106,16 +205,16 @@ class YouTubeDownloader:
         ]
 
         try:
+            # Keep stdout as bytes; the parser decodes UTF-8 itself
             result = subprocess.run(
                 cmd,
                 check=True,
-                capture_output=True,
-                text=True
+                capture_output=True
             )
 
-            metadata = json.loads(result.stdout)
+            metadata = json_loads(result.stdout)
 
-            return {
+            info = {
                 'title': metadata.get('title'),
                 'duration': metadata.get('duration'),
                 'width': metadata.get('width'),
@@ -125,10 +224,33 @@ class YouTubeDownloader:
                 'channel': metadata.get('channel')
             }
 
+            # Write to a temp file and rename so readers never see a partial file
+            self._info_cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._info_cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(info, f)
+            os.replace(tmp_path, cache_path)
+
+            return info
+
         except subprocess.CalledProcessError as e:
-            print(f"Failed to get video info: {e.stderr}")
+            print(f"Failed to get video info: {e.stderr.decode(errors='replace')}")
             raise
 
+    def get_video_info_many(self, urls: List[str], max_workers: int = 16) -> Dict[str, Dict]:
+        """
+        Fetch metadata for several videos concurrently.
+
+        Args:
+            urls: YouTube video URLs
+            max_workers: Maximum simultaneous metadata requests
+
+        Returns:
+            Dictionary mapping each URL to its metadata (None if the lookup failed)
+        """
+        infos = self._run_parallel(self.get_video_info, [{'url': url} for url in urls], max_workers)
+        return dict(zip(urls, infos))
+
     def search_play_footage(
         self,
         qb_name: str,
@@ -168,33 +290,54 @@ class YouTubeDownloader:
         input_path: Path,
         output_path: Path,
         start_time: float,
-        duration: float
+        duration: float,
+        accurate: bool = False
     ):
         """
         Trim video to specific time range using ffmpeg.
 
+        By default packets are stream-copied (no re-encode), which is fast and
+        lossless but cuts at the nearest keyframe. Pass accurate=True for a
+        frame-exact cut, which re-encodes the clip.
+
         Args:
             input_path: Path to input video
             output_path: Path for output video
             start_time: Start time in seconds
             duration: Duration in seconds
+            accurate: Re-encode for frame-exact cut points
 
         Requires:
             ffmpeg installed
         """
-        cmd = [
-            "ffmpeg",
-            "-i", str(input_path),
-            "-ss", str(start_time),
-            "-t", str(duration),
-            "-c:v", "libx264",
-            "-c:a", "aac",
-            "-y",  # Overwrite output file
-            str(output_path)
-        ]
+        if accurate:
+            cmd = [
+                "ffmpeg",
+                "-i", str(input_path),
+                "-ss", str(start_time),
+                "-t", str(duration),
+                "-c:v", "libx264",
+                "-preset", "ultrafast",
+                "-crf", "23",
+                "-c:a", "aac",
+                "-threads", "0",
+                "-y",  # Overwrite output file
+                str(output_path)
+            ]
+        else:
+            cmd = [
+                "ffmpeg",
+                "-ss", str(start_time),  # Input seek (before -i) skips decoding
+                "-i", str(input_path),
+                "-t", str(duration),
+                "-c", "copy",
+                "-avoid_negative_ts", "make_zero",
+                "-y",  # Overwrite output file
+                str(output_path)
+            ]
 
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            self._run_with_stderr_tail(cmd)
             print(f"Video trimmed successfully: {output_path}")
 
         except subprocess.CalledProcessError as e:
@@ -206,6 +349,23 @@ class YouTubeDownloader:
                 "ffmpeg not found. Install with: sudo apt-get install ffmpeg"
             )
 
+    def trim_many(self, jobs: List[Dict], max_workers: int = 4) -> List[Optional[Path]]:
+        """
+        Trim several videos concurrently.
+
+        Args:
+            jobs: One dict of trim_video keyword arguments per clip
+            max_workers: Maximum simultaneous ffmpeg processes
+
+        Returns:
+            Output paths in job order (None for failed trims)
+        """
+        def trim(**job):
+            self.trim_video(**job)
+            return Path(job['output_path'])
+
+        return self._run_parallel(trim, jobs, max_workers)
+
 
 class PlayVideoMatcher:
     """Match tracking data plays to YouTube footage."""
@@ -266,24 +426,34 @@ class PlayVideoMatcher:
             min_air_yards: Minimum air yards (big plays more likely on YouTube)
 
         Returns:
-            Filtered DataFrame with plays likely to have footage
+            Filtered DataFrame with plays likely to have footage, with
+            is_touchdown (and its is_td alias) columns, touchdowns first then
+            longest passes
         """
         # Big plays in prime time games most likely to have footage
-        candidates = plays_df[
-            (plays_df['passLength'] >= min_air_yards) &
-            (plays_df['passResult'].isin(['C', 'IN']))  # Completions or picks
-        ].copy()
-
-        # Prioritize touchdowns
-        candidates['is_td'] = candidates['playDescription'].str.contains(
-            'TOUCHDOWN',
-            case=False,
-            na=False
+        mask = (
+            plays_df['passLength'].ge(min_air_yards).to_numpy() &
+            plays_df['passResult'].isin(['C', 'IN']).to_numpy()  # Completions or picks
         )
+        candidates = plays_df.loc[mask]
+
+        # Prioritize touchdowns; PlayRecommender inventories already carry the flag
+        if 'is_touchdown' in candidates.columns:
+            is_touchdown = candidates['is_touchdown']
+        else:
+            is_touchdown = candidates['playDescription'].str.contains(
+                'TOUCHDOWN',
+                case=False,
+                regex=False,
+                na=False
+            )
+        # is_td is kept for existing callers
+        candidates = candidates.assign(is_touchdown=is_touchdown, is_td=is_touchdown)
 
         candidates = candidates.sort_values(
-            by=['is_td', 'passLength'],
-            ascending=[False, False]
+            by=['is_touchdown', 'passLength'],
+            ascending=[False, False],
+            kind='stable'
         )
 
         return candidates
@@ -8,14 +8,154 @@ import pandas as pd
 from pathlib import Path
 from typing import Tuple, Dict, Optional, List
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+
+# Jersey number text style shared by draw_player and the player chips
+JERSEY_FONT = cv2.FONT_HERSHEY_SIMPLEX
+JERSEY_FONT_SCALE = 0.5
+JERSEY_THICKNESS = 2
+
+# Below this many points the host-device copies cost more than the projection
+GPU_MIN_POINTS = 100_000
+
+
+def _blit_chips_loop(frame, chips, masks, chip_idx, corners):
+    """Copy masked chip pixels onto the frame, clipping at its edges (JIT target)."""
+    height, width = frame.shape[0], frame.shape[1]
+    chip_h, chip_w = masks.shape[1], masks.shape[2]
+
+    # Sequential so later players are drawn on top, as with draw_player calls
+    for p in range(chip_idx.shape[0]):
+        k = chip_idx[p]
+        x0 = corners[p, 0]
+        y0 = corners[p, 1]
+        for i in range(chip_h):
+            y = y0 + i
+            if y < 0 or y >= height:
+                continue
+            for j in range(chip_w):
+                x = x0 + j
+                if x < 0 or x >= width or not masks[k, i, j]:
+                    continue
+                for c in range(3):
+                    frame[y, x, c] = chips[k, i, j, c]
+
+
+def _blit_chips_numpy(frame, chips, masks, chip_idx, corners):
+    """NumPy implementation of _blit_chips."""
+    height, width = frame.shape[:2]
+    chip_h, chip_w = masks.shape[1:]
+
+    for k, (x0, y0) in zip(chip_idx, corners):
+        # Clip the chip rectangle to the frame
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1, fy1 = min(x0 + chip_w, width), min(y0 + chip_h, height)
+        if fx0 >= fx1 or fy0 >= fy1:
+            continue
+        region = (slice(fy0 - y0, fy1 - y0), slice(fx0 - x0, fx1 - x0))
+        np.copyto(frame[fy0:fy1, fx0:fx1], chips[k][region], where=masks[k][region][..., None])
+
+
+def _frame_roi(frame, x0, y0, x1, y1):
+    """Writable view of a frame region, for ndarray and cv2.UMat frames alike."""
+    if isinstance(frame, cv2.UMat):
+        return cv2.UMat(frame, (y0, y1), (x0, x1))
+    return frame[y0:y1, x0:x1]
+
+
+def _paste_chip(frame, frame_size, chip, mask, x0, y0):
+    """Copy the masked pixels of one chip onto the frame at (x0, y0), clipped to its edges."""
+    height, width = frame_size
+    chip_h, chip_w = mask.shape
+
+    fx0, fy0 = max(x0, 0), max(y0, 0)
+    fx1, fy1 = min(x0 + chip_w, width), min(y0 + chip_h, height)
+    if fx0 >= fx1 or fy0 >= fy1:
+        return
+    region = (slice(fy0 - y0, fy1 - y0), slice(fx0 - x0, fx1 - x0))
+    roi = _frame_roi(frame, fx0, fy0, fx1, fy1)
+    cv2.copyTo(chip[region], mask[region].view(np.uint8), dst=roi)
+
+
+def _blend_chip(frame, frame_size, color, alpha, x0, y0):
+    """Alpha-blend a (color, (alpha, 1 - alpha)) chip onto the frame at (x0, y0), clipped to its edges."""
+    height, width = frame_size
+    chip_h, chip_w = color.shape[:2]
+
+    fx0, fy0 = max(x0, 0), max(y0, 0)
+    fx1, fy1 = min(x0 + chip_w, width), min(y0 + chip_h, height)
+    if fx0 >= fx1 or fy0 >= fy1:
+        return
+    region = (slice(fy0 - y0, fy1 - y0), slice(fx0 - x0, fx1 - x0))
+    weight, inverse = alpha
+    roi = _frame_roi(frame, fx0, fy0, fx1, fy1)
+    cv2.blendLinear(roi, color[region], inverse[region], weight[region], dst=roi)
+
+
+def _four_point_homography(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    Exact homography mapping 4 source points onto 4 destination points.
+
+    Solves the 8x8 DLT system with H[2, 2] fixed to 1, which is what
+    cv2.findHomography converges to for exactly 4 correspondences.
+
+    Args:
+        src: Source (x, y) points (4x2)
+        dst: Destination (x, y) points (4x2)
+
+    Returns:
+        3x3 homography matrix (float64)
+    """
+    # Two equations per correspondence:
+    #   u = (h0 x + h1 y + h2) / (h6 x + h7 y + 1)
+    #   v = (h3 x + h4 y + h5) / (h6 x + h7 y + 1)
+    A = np.zeros((8, 8))
+    A[:4, 0:2] = src
+    A[:4, 2] = 1
+    A[:4, 6:] = -src * dst[:, :1]
+    A[4:, 3:5] = src
+    A[4:, 5] = 1
+    A[4:, 6:] = -src * dst[:, 1:]
+    h = np.linalg.solve(A, dst.T.ravel())
+
+    return np.append(h, 1.0).reshape(3, 3)
+
+
+# _blit_chips(frame, chips, masks, chip_idx, corners)
+#   Paste chips[chip_idx[p]] where masks[chip_idx[p]] is set, with its top-left
+#   corner at corners[p] (x, y), for every player p in order.
+if NUMBA_AVAILABLE:
+    _blit_chips = njit(cache=True)(_blit_chips_loop)
+else:
+    _blit_chips = _blit_chips_numpy
+
 
 class TrackingOverlayRenderer:
     """Render tracking data overlays on video frames."""
 
+    # Separation line color (BGR) per half-yard bucket: red under 2 yds (tight
+    # coverage), yellow under 5 yds (moderate separation), green beyond (open)
+    _SEP_COLOR_LUT = np.array(
+        [[0, 0, 255]] * 4 + [[0, 255, 255]] * 6 + [[0, 255, 0]],
+        dtype=np.uint8
+    )
+
     def __init__(
         self,
         field_bounds: Tuple[int, int, int, int] = None,
-        colors: Dict[str, Tuple[int, int, int]] = None
+        colors: Dict[str, Tuple[int, int, int]] = None,
+        use_umat: bool = False
     ):
         """
         Initialize overlay renderer.
@@ -23,9 +163,20 @@ class TrackingOverlayRenderer:
         Args:
             field_bounds: (x_min, y_min, x_max, y_max) pixel coordinates of field in video
             colors: Dictionary mapping team names to BGR colors for OpenCV
+            use_umat: Draw on cv2.UMat frames so OpenCV can run the drawing
+                      through OpenCL (ignored when OpenCL is not available)
         """
         self.field_bounds = field_bounds
 
+        self.use_umat = use_umat and cv2.ocl.haveOpenCL()
+        if self.use_umat:
+            cv2.ocl.setUseOpenCL(True)
+        elif use_umat:
+            print("OpenCL not available, drawing on CPU frames")
+
+        # (height, width) of uploaded frames; UMat does not expose its shape
+        self._umat_size = None
+
         if colors is None:
             # Default colors (BGR format for OpenCV)
             self.colors = {
@@ -36,6 +187,16 @@ class TrackingOverlayRenderer:
         else:
             self.colors = colors
 
+        # Pre-rendered player markers keyed by (team, jersey number, radius)
+        self._chip_cache = {}
+
+        # Pre-rendered outlined text (jersey numbers, speeds) keyed by
+        # (text, font, font scale, thickness, text color, outline color)
+        self._text_atlas = {}
+
+        # Rendered text of the last info overlay, as (info items, chip, weights)
+        self._info_chip = None
+
     def set_field_calibration(
         self,
         video_points: np.ndarray,
@@ -67,11 +228,61 @@ class TrackingOverlayRenderer:
 
             renderer.set_field_calibration(video_pts, field_pts)
         """
-        # Compute homography matrix
-        self.homography, _ = cv2.findHomography(field_points, video_points)
+        field_points = np.asarray(field_points, dtype=np.float64).reshape(-1, 2)
+        video_points = np.asarray(video_points, dtype=np.float64).reshape(-1, 2)
+
+        # Compute homography matrix: closed form for the usual 4 corners,
+        # least squares over all points otherwise
+        if len(field_points) == 4:
+            homography = _four_point_homography(field_points, video_points)
+        else:
+            homography, _ = cv2.findHomography(field_points, video_points, method=0)
+        self.homography = homography.astype(np.float64)
+
+        # Transposed copy for the GPU row-vector projection
+        self._H_T = np.ascontiguousarray(self.homography.T)
+
+        # Plain Python floats shared by the scalar and batch projections
+        self._h_coeffs = self.homography.ravel().tolist()
 
         print(f"Field calibration set with {len(video_points)} points")
 
+    def upload_frame(self, frame: np.ndarray):
+        """
+        Prepare a decoded frame for drawing.
+
+        Args:
+            frame: Video frame (numpy array)
+
+        Returns:
+            cv2.UMat wrapping the frame when use_umat is on, else the frame itself
+        """
+        if not self.use_umat:
+            return frame
+
+        self._umat_size = frame.shape[:2]
+        return cv2.UMat(frame)
+
+    def download_frame(self, frame) -> np.ndarray:
+        """
+        Get a drawn frame back as a numpy array (e.g. before VideoWriter.write).
+
+        Args:
+            frame: Frame returned by upload_frame
+
+        Returns:
+            Video frame (numpy array)
+        """
+        if isinstance(frame, cv2.UMat):
+            return frame.get()
+        return frame
+
+    def _frame_size(self, frame) -> Tuple[int, int]:
+        """(height, width) of a numpy or uploaded UMat frame."""
+        if isinstance(frame, cv2.UMat):
+            return self._umat_size
+        return frame.shape[:2]
+
     def field_to_video_coords(self, x: float, y: float) -> Tuple[int, int]:
         """
         Transform field coordinates to video pixel coordinates.
@@ -86,14 +297,69 @@ class TrackingOverlayRenderer:
         if not hasattr(self, 'homography'):
             raise ValueError("Field calibration not set. Call set_field_calibration() first.")
 
-        # Apply homography transformation
-        field_pt = np.array([[[x, y]]], dtype=np.float32)
-        video_pt = cv2.perspectiveTransform(field_pt, self.homography)
+        # Scalar arithmetic: a 1-point NumPy batch costs ~10x more in overhead.
+        # Same steps as cv2.perspectiveTransform on float32 points (and the
+        # batch path): float32 inputs, float64 math, float32 result, truncated
+        h = self._h_coeffs
+        x, y = float(np.float32(x)), float(np.float32(y))
+        w = 1.0 / (x * h[6] + y * h[7] + h[8])
+        pixel_x = np.float32((x * h[0] + y * h[1] + h[2]) * w)
+        pixel_y = np.float32((x * h[3] + y * h[4] + h[5]) * w)
+
+        return int(pixel_x), int(pixel_y)
+
+    def field_to_video_coords_batch(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Transform many field coordinates to video pixel coordinates at once.
+
+        Args:
+            xy: Array of (x, y) yard coordinates (Nx2)
+
+        Returns:
+            Array of (pixel_x, pixel_y) in video (Nx2, int32, truncated)
+        """
+        if not hasattr(self, 'homography'):
+            raise ValueError("Field calibration not set. Call set_field_calibration() first.")
+
+        # Apply homography transformation with the same rounding steps as
+        # field_to_video_coords and cv2.perspectiveTransform
+        h = self._h_coeffs
+        xy = np.asarray(xy, dtype=np.float32).reshape(-1, 2).astype(np.float64)
+        x, y = xy[:, 0], xy[:, 1]
+        w = 1.0 / (x * h[6] + y * h[7] + h[8])
+        pixels = np.empty((len(xy), 2), dtype=np.float32)
+        pixels[:, 0] = (x * h[0] + y * h[1] + h[2]) * w
+        pixels[:, 1] = (x * h[3] + y * h[4] + h[5]) * w
 
-        pixel_x = int(video_pt[0][0][0])
-        pixel_y = int(video_pt[0][0][1])
+        return pixels.astype(np.int32)
 
-        return pixel_x, pixel_y
+    def transform_all_positions(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Project every tracking position of a play (or a whole game) at once.
+
+        Large batches are projected on the GPU with CuPy when it is installed;
+        otherwise this is field_to_video_coords_batch. Project once up front,
+        then pass slices of the result to draw_players_batch(pixels=...).
+
+        Args:
+            xy: Array of (x, y) yard coordinates (Nx2)
+
+        Returns:
+            Array of (pixel_x, pixel_y) in video (Nx2, int32, truncated)
+        """
+        xy = np.asarray(xy, dtype=np.float32).reshape(-1, 2)
+        if not CUPY_AVAILABLE or len(xy) < GPU_MIN_POINTS:
+            return self.field_to_video_coords_batch(xy)
+
+        if not hasattr(self, 'homography'):
+            raise ValueError("Field calibration not set. Call set_field_calibration() first.")
+
+        # float64 projection like the CPU path, in one transfer each way
+        H_T = cp.asarray(self._H_T)
+        projected = cp.asarray(xy, dtype=cp.float64) @ H_T[:2] + H_T[2]
+        pixels = (projected[:, :2] / projected[:, 2:3]).astype(cp.float32)
+
+        return cp.asnumpy(pixels.astype(cp.int32))
 
     def draw_player(
         self,
@@ -107,6 +373,10 @@ class TrackingOverlayRenderer:
         """
         Draw a player marker on the frame.
 
+        The marker (filled circle, outline and number) is pasted from the same
+        cached chip that draw_players_batch uses, so each call is one masked
+        copy instead of two circles and the number text.
+
         Args:
             frame: Video frame (numpy array)
             x: Player x-coordinate in yards
@@ -120,32 +390,219 @@ class TrackingOverlayRenderer:
         """
         pixel_x, pixel_y = self.field_to_video_coords(x, y)
 
-        color = self.colors.get(team, (255, 255, 255))
+        if jersey_number is not None and pd.isna(jersey_number):
+            jersey_number = None
+        elif jersey_number is not None:
+            jersey_number = int(jersey_number)
+        chip, mask = self._player_chip(team, jersey_number, radius)
+
+        _paste_chip(
+            frame, self._frame_size(frame), chip, mask,
+            pixel_x - (radius + 2), pixel_y - (radius + 2)
+        )
 
+        return frame
+
+    def _draw_marker(
+        self,
+        frame: np.ndarray,
+        pixel_x: int,
+        pixel_y: int,
+        color: Tuple[int, int, int],
+        jersey_number: Optional[int],
+        radius: int,
+        outline_color: Tuple[int, int, int] = (0, 0, 0),
+        text_color: Tuple[int, int, int] = (255, 255, 255)
+    ) -> np.ndarray:
+        """Draw a player circle and jersey number centred on a pixel."""
         # Draw circle
         cv2.circle(frame, (pixel_x, pixel_y), radius, color, -1)
         cv2.circle(frame, (pixel_x, pixel_y), radius, (255, 255, 255), 2)
 
         # Draw jersey number
         if jersey_number is not None:
-            text = str(int(jersey_number))
-            font = cv2.FONT_HERSHEY_BOLD
-            font_scale = 0.5
-            thickness = 2
+            chip, alpha, text_size, (dx, dy) = self._text_chip(
+                str(int(jersey_number)), JERSEY_FONT, JERSEY_FONT_SCALE,
+                JERSEY_THICKNESS, text_color, outline_color
+            )
 
-            # Get text size for centering
-            text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+            # Centre the text on the marker
             text_x = pixel_x - text_size[0] // 2
             text_y = pixel_y + text_size[1] // 2
+            _blend_chip(frame, self._frame_size(frame), chip, alpha, text_x + dx, text_y + dy)
 
-            cv2.putText(
-                frame, text, (text_x, text_y),
-                font, font_scale, (0, 0, 0), thickness + 1
-            )  # Black outline
-            cv2.putText(
-                frame, text, (text_x, text_y),
-                font, font_scale, (255, 255, 255), thickness
-            )  # White text
+        return frame
+
+    def _text_chip(
+        self,
+        text: str,
+        font: int,
+        font_scale: float,
+        thickness: int,
+        color: Tuple[int, int, int],
+        outline_color: Tuple[int, int, int] = (0, 0, 0)
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray], Tuple[int, int], Tuple[int, int]]:
+        """
+        Get outlined text as a pre-rendered chip, rendering it on first use.
+
+        The chip is the outline followed by the fill, as the two putText calls
+        would draw them, stored as color plus coverage so that pasting it with
+        one blendLinear call replaces getTextSize and both putText calls.
+
+        Args:
+            text: Text to render
+            font: OpenCV font face
+            font_scale: Font scale
+            thickness: Fill thickness (the outline is one pixel thicker)
+            color: Fill BGR color
+            outline_color: Outline BGR color
+
+        Returns:
+            Tuple of (BGR chip, (coverage, 1 - coverage) float32 weights,
+            (width, height) from getTextSize, (dx, dy) offset of the chip's
+            top-left corner from the text origin)
+        """
+        key = (text, font, font_scale, thickness, color, outline_color)
+        entry = self._text_atlas.get(key)
+        if entry is None:
+            (width, height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+
+            # Room for the outline stroke on every side and descenders below
+            pad = thickness + 2
+            size = (height + baseline + 2 * pad, width + 2 * pad)
+            origin = (pad, pad + height)
+
+            # Coverage of each stroke, then fill composited over outline
+            outline = np.zeros(size, dtype=np.uint8)
+            fill = np.zeros(size, dtype=np.uint8)
+            cv2.putText(outline, text, origin, font, font_scale, 255, thickness + 1)
+            cv2.putText(fill, text, origin, font, font_scale, 255, thickness)
+            a_outline = outline.astype(np.float32)[..., None] / 255
+            a_fill = fill.astype(np.float32)[..., None] / 255
+
+            alpha = 1 - (1 - a_outline) * (1 - a_fill)
+            premultiplied = (
+                np.array(outline_color, dtype=np.float32) * a_outline * (1 - a_fill)
+                + np.array(color, dtype=np.float32) * a_fill
+            )
+            chip = (premultiplied / np.maximum(alpha, 1e-6) + 0.5).astype(np.uint8)
+            alpha = alpha[..., 0]
+
+            # Crop to the pixels actually drawn
+            rows = np.flatnonzero(alpha.any(axis=1))
+            cols = np.flatnonzero(alpha.any(axis=0))
+            y0, y1 = rows[0], rows[-1] + 1
+            x0, x1 = cols[0], cols[-1] + 1
+            chip = np.ascontiguousarray(chip[y0:y1, x0:x1])
+            alpha = np.ascontiguousarray(alpha[y0:y1, x0:x1])
+
+            offset = (int(x0) - origin[0], int(y0) - origin[1])
+            entry = (chip, (alpha, 1 - alpha), (width, height), offset)
+            self._text_atlas[key] = entry
+        return entry
+
+    def _player_chip(
+        self,
+        team: str,
+        jersey_number: Optional[int],
+        radius: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the pre-rendered marker for a player, rendering it on first use.
+
+        The chip is exactly what draw_player would draw, centred in a square
+        canvas, plus a mask of the pixels it covers.
+
+        Args:
+            team: Team identifier
+            jersey_number: Jersey number to display (None for no number)
+            radius: Marker radius in pixels
+
+        Returns:
+            Tuple of (BGR chip, boolean mask), both (2r+5)x(2r+5)
+        """
+        key = (team, jersey_number, radius)
+        chip = self._chip_cache.get(key)
+        if chip is None:
+            size = 2 * (radius + 2) + 1
+            canvas = np.zeros((size, size, 3), dtype=np.uint8)
+            mask = np.zeros((size, size, 3), dtype=np.uint8)
+            center = radius + 2
+
+            color = self.colors.get(team, (255, 255, 255))
+            self._draw_marker(canvas, center, center, color, jersey_number, radius)
+
+            # Same shapes all in white give the coverage mask
+            white = (255, 255, 255)
+            self._draw_marker(mask, center, center, white, jersey_number, radius, white, white)
+
+            chip = (canvas, mask[..., 0] > 0)
+            self._chip_cache[key] = chip
+        return chip
+
+    def draw_players_batch(
+        self,
+        frame: np.ndarray,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        teams: List[str],
+        jersey_numbers: Optional[List[Optional[int]]] = None,
+        radius: int = 15,
+        pixels: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Draw many player markers in one call.
+
+        Each distinct (team, jersey number) marker is rendered once and cached;
+        drawing a frame then projects all positions in one batch and pastes the
+        cached chips, compiled with numba when it is available.
+
+        Args:
+            frame: Video frame (numpy array)
+            xs: Player x-coordinates in yards
+            ys: Player y-coordinates in yards
+            teams: Team identifier per player
+            jersey_numbers: Jersey number per player (None/NaN for no number)
+            radius: Marker radius in pixels
+            pixels: Pixel coordinates already projected with
+                    transform_all_positions (Nx2); xs and ys are then unused
+
+        Returns:
+            Frame with players drawn
+        """
+        if len(teams) == 0:
+            return frame
+        if jersey_numbers is None:
+            jersey_numbers = [None] * len(teams)
+
+        if pixels is None:
+            pixels = self.field_to_video_coords_batch(np.column_stack([xs, ys]))
+
+        # One chip per distinct marker in this frame
+        keys = [
+            (team, None if number is None or pd.isna(number) else int(number))
+            for team, number in zip(teams, jersey_numbers)
+        ]
+        unique_keys = list(dict.fromkeys(keys))
+        key_index = {key: i for i, key in enumerate(unique_keys)}
+        chips = [self._player_chip(team, number, radius) for team, number in unique_keys]
+        corners = (pixels - (radius + 2)).astype(np.int64)
+
+        if isinstance(frame, cv2.UMat):
+            # Masked copy per player, kept on the device
+            frame_size = self._frame_size(frame)
+            for key, (x0, y0) in zip(keys, corners.tolist()):
+                chip, mask = chips[key_index[key]]
+                _paste_chip(frame, frame_size, chip, mask, x0, y0)
+            return frame
+
+        _blit_chips(
+            frame,
+            np.stack([chip for chip, _ in chips]),
+            np.stack([mask for _, mask in chips]),
+            np.array([key_index[key] for key in keys], dtype=np.int64),
+            corners
+        )
 
         return frame
 
@@ -173,25 +630,34 @@ class TrackingOverlayRenderer:
 
         color = self.colors.get(team, (255, 255, 255))
 
-        # Convert positions to pixel coordinates
-        pixel_positions = [
-            self.field_to_video_coords(x, y) for x, y in positions
-        ]
-
-        # Draw line segments with decreasing opacity
-        for i in range(len(pixel_positions) - 1):
-            start = pixel_positions[i]
-            end = pixel_positions[i + 1]
-
-            # Opacity decreases for older positions
-            segment_alpha = alpha * ((len(pixel_positions) - i) / len(pixel_positions))
+        # Convert positions to pixel coordinates in one batch
+        pixel_positions = self.field_to_video_coords_batch(positions)
+        n_points = len(pixel_positions)
+        thickness = 3
+
+        # Bounding box of the trail (padded by the line width), clipped to the frame
+        x0, y0 = np.maximum(pixel_positions.min(axis=0) - thickness, 0)
+        height, width = self._frame_size(frame)
+        x1, y1 = np.minimum(
+            pixel_positions.max(axis=0) + thickness + 1,
+            (width, height)
+        )
+        if x0 >= x1 or y0 >= y1:
+            return frame
 
-            # Create overlay
-            overlay = frame.copy()
-            cv2.line(overlay, start, end, color, 3)
+        # Per-pixel opacity: older segments fade out. Draw oldest first so
+        # newer, more opaque segments win where segments meet.
+        alpha_mask = np.zeros((y1 - y0, x1 - x0), dtype=np.float32)
+        local = pixel_positions - (x0, y0)
+        for i in reversed(range(n_points - 1)):
+            segment_alpha = alpha * ((n_points - i) / n_points)
+            cv2.line(alpha_mask, tuple(local[i].tolist()), tuple(local[i + 1].tolist()), segment_alpha, thickness)
 
-            # Blend with original frame
-            cv2.addWeighted(overlay, segment_alpha, frame, 1 - segment_alpha, 0, frame)
+        # Blend once over the trail's region only
+        roi = _frame_roi(frame, int(x0), int(y0), int(x1), int(y1))
+        color_patch = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        color_patch[:] = color
+        cv2.blendLinear(roi, color_patch, 1 - alpha_mask, alpha_mask, dst=roi)
 
         return frame
 
@@ -214,18 +680,15 @@ class TrackingOverlayRenderer:
         Returns:
             Frame with separation line drawn
         """
-        rec_pixel = self.field_to_video_coords(*receiver_pos)
-        def_pixel = self.field_to_video_coords(*defender_pos)
+        rec_pixel, def_pixel = (
+            tuple(p) for p in self.field_to_video_coords_batch([receiver_pos, defender_pos]).tolist()
+        )
 
         # Color-code by distance
-        if distance < 2:
-            color = (0, 0, 255)      # Red: tight coverage
-        elif distance < 5:
-            color = (0, 255, 255)    # Yellow: moderate separation
-        else:
-            color = (0, 255, 0)      # Green: open
+        color = tuple(self.separation_colors(distance).tolist())
 
-        # Draw line
+        # Draw line (rasterizing a short opaque line is cheaper than pasting a
+        # cached template of it, unlike the anti-aliased text)
         cv2.line(frame, rec_pixel, def_pixel, color, 2)
 
         # Draw distance text at midpoint
@@ -254,6 +717,23 @@ class TrackingOverlayRenderer:
 
         return frame
 
+    def separation_colors(self, distances) -> np.ndarray:
+        """
+        Look up separation line colors for one or many distances at once.
+
+        Args:
+            distances: Separation distance(s) in yards
+
+        Returns:
+            BGR color(s) as uint8, shape distances.shape + (3,)
+        """
+        last = len(self._SEP_COLOR_LUT) - 1
+        buckets = np.floor(np.asarray(distances, dtype=np.float64) * 2)
+        # NaN distances fall in the last bucket, like the old if/elif chain
+        buckets = np.clip(np.nan_to_num(buckets, nan=last), 0, last).astype(np.intp)
+
+        return self._SEP_COLOR_LUT[buckets]
+
     def draw_speed_indicator(
         self,
         frame: np.ndarray,
@@ -298,24 +778,15 @@ class TrackingOverlayRenderer:
             tipLength=0.3
         )
 
-        # Draw speed text
+        # Draw speed text (one cached chip per 0.1 mph step)
         speed_mph = speed * 2.04545  # Convert yards/sec to mph
         text = f"{speed_mph:.1f} mph"
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 0.4
-        thickness = 1
 
         text_x = pixel_x + 5
         text_y = pixel_y - 10
 
-        cv2.putText(
-            frame, text, (text_x, text_y),
-            font, font_scale, (0, 0, 0), thickness + 1
-        )  # Outline
-        cv2.putText(
-            frame, text, (text_x, text_y),
-            font, font_scale, color, thickness
-        )
+        chip, alpha, _, (dx, dy) = self._text_chip(text, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1, color)
+        _blend_chip(frame, self._frame_size(frame), chip, alpha, text_x + dx, text_y + dy)
 
         return frame
 
@@ -342,35 +813,51 @@ class TrackingOverlayRenderer:
         line_height = 30
 
         # Determine starting position
+        height, width = self._frame_size(frame)
         if position == 'top-left':
             x, y = 20, 40
         elif position == 'top-right':
-            x, y = frame.shape[1] - 300, 40
+            x, y = width - 300, 40
         elif position == 'bottom-left':
-            x, y = 20, frame.shape[0] - (len(info) * line_height) - 20
+            x, y = 20, height - (len(info) * line_height) - 20
         else:  # bottom-right
-            x, y = frame.shape[1] - 300, frame.shape[0] - (len(info) * line_height) - 20
+            x, y = width - 300, height - (len(info) * line_height) - 20
+
+        # Darken the box in place (0.7 * black + 0.3 * frame is a plain scale),
+        # touching only its pixels
+        box_x0, box_y0 = x - 10, y - 30
+        box_x1, box_y1 = x + 280, y + (len(info) * line_height) - 10
+        fx0, fy0 = max(box_x0, 0), max(box_y0, 0)
+        fx1, fy1 = min(box_x1 + 1, width), min(box_y1 + 1, height)
+        if fx0 < fx1 and fy0 < fy1:
+            roi = _frame_roi(frame, fx0, fy0, fx1, fy1)
+            cv2.convertScaleAbs(roi, dst=roi, alpha=0.3)
+
+        # Text is re-rendered only when the info changes
+        items = tuple((str(key), str(value)) for key, value in info.items())
+        if self._info_chip is None or self._info_chip[0] != items:
+            lines = [f"{key}: {value}" for key, value in items]
+            text_width = max(
+                [cv2.getTextSize(text, font, font_scale, thickness)[0][0] for text in lines],
+                default=0
+            )
 
-        # Draw semi-transparent background
-        overlay = frame.copy()
-        cv2.rectangle(
-            overlay,
-            (x - 10, y - 30),
-            (x + 280, y + (len(info) * line_height) - 10),
-            (0, 0, 0),
-            -1
-        )
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-
-        # Draw text
-        current_y = y
-        for key, value in info.items():
-            text = f"{key}: {value}"
-            cv2.putText(
-                frame, text, (x, current_y),
-                font, font_scale, (255, 255, 255), thickness
+            # Canvas anchored at the box corner, widened for text past the box
+            coverage = np.zeros(
+                (box_y1 - box_y0 + 1, max(box_x1 - box_x0 + 1, 10 + text_width + thickness + 2)),
+                dtype=np.uint8
             )
-            current_y += line_height
+            for i, text in enumerate(lines):
+                cv2.putText(
+                    coverage, text, (10, 30 + i * line_height),
+                    font, font_scale, 255, thickness
+                )
+            alpha = coverage.astype(np.float32) / 255
+            white = np.full(coverage.shape + (3,), 255, dtype=np.uint8)
+            self._info_chip = (items, white, (alpha, 1 - alpha))
+
+        _, chip, weights = self._info_chip
+        _blend_chip(frame, (height, width), chip, weights, box_x0, box_y0)
 
         return frame
 
@@ -2,27 +2,145 @@
 Synchronize NFL tracking data with video footage.
 """
 
+import os
 import cv2
 import numpy as np
 import pandas as pd
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Dict, Optional
-from scipy.interpolate import interp1d
+from typing import Tuple, Dict, Optional, Iterable, Iterator, Callable
+
+
+def _to_python_number(value):
+    """
+    Convert a NumPy scalar to the equivalent Python int or float.
+
+    Args:
+        value: Number, possibly a NumPy scalar
+
+    Returns:
+        Python number (other values are returned unchanged)
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _interp_extrapolate(x, xp: np.ndarray, fp: np.ndarray):
+    """
+    Piecewise-linear interpolation that extends the end segments linearly.
+
+    Equivalent to interp1d(xp, fp, kind='linear', fill_value='extrapolate').
+
+    Args:
+        x: Query point(s)
+        xp: Increasing sample positions (at least 2)
+        fp: Sample values
+
+    Returns:
+        Interpolated value(s), same shape as x
+    """
+    y = np.interp(x, xp, fp)
+
+    # np.interp clamps outside [xp[0], xp[-1]]; continue the end slopes instead
+    x = np.asarray(x, dtype=np.float64)
+    left_slope = (fp[1] - fp[0]) / (xp[1] - xp[0])
+    right_slope = (fp[-1] - fp[-2]) / (xp[-1] - xp[-2])
+    y = np.where(x < xp[0], fp[0] + (x - xp[0]) * left_slope, y)
+    y = np.where(x > xp[-1], fp[-1] + (x - xp[-1]) * right_slope, y)
+
+    return y
+
+
+class FramePool:
+    """Free list of reusable frame buffers, keyed by shape and dtype."""
+
+    def __init__(self, max_free: int = 32):
+        """
+        Initialize the pool.
+
+        Args:
+            max_free: Most buffers kept per shape; extra released buffers are dropped
+        """
+        self.max_free = max_free
+        # deque append/pop are atomic, so decode and writer threads can share it
+        self._free = defaultdict(deque)
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """
+        Get an uninitialized buffer, reusing a released one when possible.
+
+        Args:
+            shape: Buffer shape, e.g. (height, width, 3)
+            dtype: Buffer dtype
+
+        Returns:
+            Buffer of the requested shape and dtype
+        """
+        try:
+            return self._free[(tuple(shape), np.dtype(dtype))].pop()
+        except IndexError:
+            return np.empty(shape, dtype=dtype)
+
+    def release(self, buffer: np.ndarray):
+        """
+        Return a buffer to the pool; the caller must not use it afterwards.
+
+        Args:
+            buffer: Buffer previously obtained from acquire (or any array)
+        """
+        free = self._free[(buffer.shape, buffer.dtype)]
+        if len(free) < self.max_free:
+            free.append(buffer)
 
 
 class VideoTrackingSynchronizer:
     """Synchronize tracking data frames with video frames."""
 
-    def __init__(self, video_path: Path, tracking_data: pd.DataFrame):
+    # Forward gaps up to this many frames are decoded through instead of seeking
+    MAX_FORWARD_DECODE = 64
+
+    def __init__(
+        self,
+        video_path: Path,
+        tracking_data: pd.DataFrame,
+        frame_cache_size: int = 32
+    ):
         """
         Initialize synchronizer.
 
         Args:
             video_path: Path to video file
             tracking_data: DataFrame with tracking data (already filtered to ball-in-air)
+            frame_cache_size: Number of recently decoded video frames kept in memory
         """
         self.video_path = video_path
-        self.tracking_data = tracking_data.sort_values('frameId')
+        self.tracking_data = tracking_data.sort_values('frameId', kind='stable')
+
+        # Row range [start, stop) of each frame in the sorted data
+        frame_ids = self.tracking_data['frameId'].to_numpy()
+        unique_frames, starts = np.unique(frame_ids, return_index=True)
+        stops = np.append(starts[1:], len(frame_ids))
+        self._frame_index = dict(zip(unique_frames.tolist(), zip(starts.tolist(), stops.tolist())))
+
+        # Column arrays (SoA) for the hot paths, aligned with the sorted rows;
+        # optional columns are None when absent
+        columns = self.tracking_data.columns
+        self.np_frame = frame_ids
+        self.np_nflId = self.tracking_data['nflId'].to_numpy(dtype=np.float64)
+        for column in ['x', 'y', 's', 'dir', 'o']:
+            values = self.tracking_data[column].to_numpy(dtype=np.float64) if column in columns else None
+            setattr(self, f'np_{column}', values)
+        if 'club' in columns:
+            club = self.tracking_data['club'].astype('category')
+            self.np_club = club.cat.codes.to_numpy()
+            self.club_categories = club.cat.categories
+        else:
+            self.np_club = None
+            self.club_categories = None
+        self.np_jersey = (
+            self.tracking_data['jerseyNumber'].to_numpy(dtype=np.float64, na_value=np.nan)
+            if 'jerseyNumber' in columns else None
+        )
 
         # Load video
         self.video = cv2.VideoCapture(str(video_path))
@@ -31,6 +149,16 @@ class VideoTrackingSynchronizer:
         self.video_width = int(self.video.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.video_height = int(self.video.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
+        # Decoder position (index of the next frame read() returns) and an
+        # LRU cache of decoded frames
+        self._next_frame_num = 0
+        self._frame_cache = OrderedDict()
+        self.frame_cache_size = frame_cache_size
+
+        # Decoded frames are read into recycled buffers instead of fresh arrays
+        self._frame_pool = FramePool()
+        self._frame_shape = (self.video_height, self.video_width, 3)
+
         # Tracking data info
         self.tracking_fps = 10  # NFL tracking is 10 Hz
         self.tracking_frames = sorted(self.tracking_data['frameId'].unique())
@@ -46,6 +174,9 @@ class VideoTrackingSynchronizer:
             sync_map: Dictionary mapping tracking frame IDs to video frame numbers
                      e.g., {pass_forward_frame: 45, outcome_frame: 78}
         """
+        # Frame ids may arrive as narrow NumPy scalars (the loader reads frameId
+        # as int16); offsets and video frame numbers need Python ints
+        sync_map = {_to_python_number(k): _to_python_number(v) for k, v in sync_map.items()}
         self.sync_map = sync_map
 
         # Calculate time offset
@@ -54,18 +185,27 @@ class VideoTrackingSynchronizer:
 
         if len(sync_map) >= 2:
             # Linear interpolation between sync points
-            self.sync_interpolator = interp1d(
-                tracking_frame_ids,
-                video_frame_nums,
-                kind='linear',
-                fill_value='extrapolate'
-            )
+            order = np.argsort(tracking_frame_ids)
+            xp = np.asarray(tracking_frame_ids, dtype=np.float64)[order]
+            fp = np.asarray(video_frame_nums, dtype=np.float64)[order]
+            self.sync_interpolator = lambda v: _interp_extrapolate(v, xp, fp)
         else:
-            # Simple offset
+            # Simple offset (replacing any earlier interpolated sync)
+            if hasattr(self, 'sync_interpolator'):
+                del self.sync_interpolator
             tracking_frame = tracking_frame_ids[0]
             video_frame = video_frame_nums[0]
             self.frame_offset = video_frame - tracking_frame
 
+        # Lookup table of the video frame for every tracking frame of the play
+        self._lut_start = int(self.tracking_frames[0])
+        lut_ids = np.arange(self._lut_start, int(self.tracking_frames[-1]) + 1)
+        if len(sync_map) >= 2:
+            lut = self.sync_interpolator(lut_ids).astype(np.int64)
+        else:
+            lut = lut_ids + int(self.frame_offset)
+        self._video_frame_lut = np.maximum(np.minimum(lut, self.video_frame_count - 1), 0)
+
         print(f"Sync points set: {sync_map}")
 
     def get_video_frame_for_tracking(self, tracking_frame_id: int) -> int:
@@ -78,15 +218,35 @@ class VideoTrackingSynchronizer:
         Returns:
             Video frame number (0-indexed)
         """
+        # The table only covers whole frame ids; fractional ids (interpolated
+        # frames) are mapped exactly below
+        if hasattr(self, '_video_frame_lut') and float(tracking_frame_id).is_integer():
+            lut_idx = int(tracking_frame_id) - self._lut_start
+            if 0 <= lut_idx < len(self._video_frame_lut):
+                return int(self._video_frame_lut[lut_idx])
+
         if hasattr(self, 'sync_interpolator'):
             video_frame = int(self.sync_interpolator(tracking_frame_id))
         elif hasattr(self, 'frame_offset'):
-            video_frame = tracking_frame_id + self.frame_offset
+            video_frame = _to_python_number(tracking_frame_id) + self.frame_offset
         else:
             raise ValueError("Sync points not set. Call set_sync_points() first.")
 
         return max(0, min(video_frame, self.video_frame_count - 1))
 
+    def get_rows_for_frame(self, tracking_frame_id: int) -> pd.DataFrame:
+        """
+        Get the tracking rows of one frame without scanning the whole play.
+
+        Args:
+            tracking_frame_id: Tracking data frame ID
+
+        Returns:
+            Slice of tracking_data for that frame (empty if the frame is absent)
+        """
+        start, stop = self._frame_index.get(int(tracking_frame_id), (0, 0))
+        return self.tracking_data.iloc[start:stop]
+
     def interpolate_tracking_data(self, target_fps: int = 30) -> pd.DataFrame:
         """
         Interpolate tracking data to match video frame rate.
@@ -109,55 +269,51 @@ class VideoTrackingSynchronizer:
             num_interpolated_frames
         )
 
-        interpolated_data = []
-
-        # Interpolate each player's movement
-        for nfl_id in self.tracking_data['nflId'].unique():
-            if pd.isna(nfl_id):
-                # Handle ball (nflId is NaN)
-                player_data = self.tracking_data[
-                    self.tracking_data['nflId'].isna()
-                ].copy()
-            else:
-                player_data = self.tracking_data[
-                    self.tracking_data['nflId'] == nfl_id
-                ].copy()
-
-            if len(player_data) < 2:
-                continue
+        columns = [c for c in ['x', 'y', 's', 'dir', 'o'] if getattr(self, f'np_{c}') is not None]
+        n_new = len(new_frames)
 
-            player_data = player_data.sort_values('frameId')
-
-            # Interpolate x, y, s (speed), dir (direction)
-            for column in ['x', 'y', 's', 'dir', 'o']:
-                if column in player_data.columns:
-                    # Create interpolator
-                    f = interp1d(
-                        player_data['frameId'],
-                        player_data[column],
-                        kind='linear',
-                        fill_value='extrapolate'
-                    )
-
-                    # Interpolate values
-                    interpolated_values = f(new_frames)
-
-                    # Store in player data
-                    for i, (frame, value) in enumerate(zip(new_frames, interpolated_values)):
-                        if i >= len(interpolated_data):
-                            interpolated_data.append({
-                                'frameId': frame,
-                                'interpolated_frame_idx': i,
-                                'nflId': nfl_id,
-                                'club': player_data.iloc[0]['club'],
-                                'jerseyNumber': player_data.iloc[0].get('jerseyNumber'),
-                                column: value
-                            })
-                        else:
-                            if interpolated_data[i]['nflId'] == nfl_id:
-                                interpolated_data[i][column] = value
-
-        interpolated_df = pd.DataFrame(interpolated_data)
+        # Group rows by player (the ball is the NaN nflId) in order of first
+        # appearance; the stable sort keeps each player's rows in frame order
+        _, first_rows, player_idx = np.unique(
+            self.np_nflId, return_index=True, return_inverse=True
+        )
+        appearance = np.argsort(first_rows, kind='stable')
+        rank = np.empty_like(appearance)
+        rank[appearance] = np.arange(len(appearance))
+        order = np.argsort(rank[player_idx], kind='stable')
+        counts = np.bincount(rank[player_idx], minlength=len(appearance))
+        stops = np.cumsum(counts)
+
+        # Interpolate each player's movement per column; a player missing the
+        # first or last frames of the play is extrapolated along its end slope
+        players = []
+        values = {column: [] for column in columns}
+        for start, stop in zip(stops - counts, stops):
+            if stop - start < 2:
+                continue
+            rows = order[start:stop]
+            frame_ids = self.np_frame[rows].astype(np.float64)
+            players.append(rows[0])
+            for column in columns:
+                values[column].append(
+                    _interp_extrapolate(new_frames, frame_ids, getattr(self, f'np_{column}')[rows])
+                )
+
+        if players:
+            player_rows = np.repeat(np.array(players), n_new)
+            interpolated_df = pd.DataFrame({
+                'frameId': np.tile(new_frames, len(players)),
+                'interpolated_frame_idx': np.tile(np.arange(n_new), len(players)),
+                'nflId': self.np_nflId[player_rows],
+                'club': (
+                    pd.Categorical.from_codes(self.np_club[player_rows], self.club_categories)
+                    if self.np_club is not None else None
+                ),
+                'jerseyNumber': self.np_jersey[player_rows] if self.np_jersey is not None else None,
+                **{column: np.concatenate(values[column]) for column in columns}
+            })
+        else:
+            interpolated_df = pd.DataFrame()
 
         print(f"Interpolated {len(self.tracking_frames)} frames to {len(new_frames)} frames")
 
@@ -175,18 +331,152 @@ class VideoTrackingSynchronizer:
         """
         video_frame_num = self.get_video_frame_for_tracking(tracking_frame_id)
 
-        # Seek to frame
-        self.video.set(cv2.CAP_PROP_POS_FRAMES, video_frame_num)
+        frame = self._read_video_frame(video_frame_num)
+
+        if frame is None:
+            print(f"Failed to read video frame {video_frame_num}")
+
+        return frame
+
+    def iter_synced_frames(
+        self,
+        tracking_frame_ids: Iterable[int]
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield video frames for many tracking frames in one forward pass.
+
+        Requests are ordered by video frame number so the decoder only moves
+        forward; frames that fail to decode are skipped.
+
+        Args:
+            tracking_frame_ids: Tracking data frame IDs
+
+        Yields:
+            (tracking_frame_id, video frame) pairs in video order
+        """
+        requests = sorted(
+            (self.get_video_frame_for_tracking(fid), fid) for fid in tracking_frame_ids
+        )
+
+        for video_frame_num, tracking_frame_id in requests:
+            frame = self._read_video_frame(video_frame_num)
+            if frame is not None:
+                yield tracking_frame_id, frame
+
+    def render_video(
+        self,
+        out_path: Path,
+        draw_fn: Callable[[np.ndarray, pd.DataFrame], np.ndarray],
+        max_workers: Optional[int] = None
+    ) -> Path:
+        """
+        Render the synced span of the video with an overlay drawn on every frame.
+
+        Frames are decoded sequentially on the calling thread, drawn by a
+        thread pool (OpenCV releases the GIL while drawing) and written back
+        in order. At most 2 x max_workers frames are in flight at once.
+
+        Args:
+            out_path: Output video path
+            draw_fn: Called as draw_fn(frame, tracking_slice) and returns the
+                     frame to write; tracking_slice holds the tracking rows of
+                     the latest tracking frame reached by that video frame
+            max_workers: Number of drawing threads (defaults to CPU count)
+
+        Returns:
+            Path to the rendered video
+        """
+        video_frame_nums = np.array(
+            [self.get_video_frame_for_tracking(fid) for fid in self.tracking_frames]
+        )
+        first_frame, last_frame = int(video_frame_nums[0]), int(video_frame_nums[-1])
+
+        # Tracking frame shown on each video frame of the span
+        tracking_positions = np.searchsorted(
+            video_frame_nums, np.arange(first_frame, last_frame + 1), side='right'
+        ) - 1
 
-        # Read frame
-        success, frame = self.video.read()
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = 2 * max_workers
 
-        if success:
-            return frame
+        writer = cv2.VideoWriter(
+            str(out_path),
+            cv2.VideoWriter_fourcc(*'mp4v'),
+            self.video_fps,
+            (self.video_width, self.video_height)
+        )
+
+        self.video.set(cv2.CAP_PROP_POS_FRAMES, first_frame)
+        frames_read = 0
+        pending = deque()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for position in tracking_positions:
+                    success, frame = self.video.read(self._frame_pool.acquire(self._frame_shape))
+                    if not success:
+                        break
+                    frames_read += 1
+
+                    tracking_slice = self.get_rows_for_frame(self.tracking_frames[position])
+                    pending.append((executor.submit(draw_fn, frame, tracking_slice), frame))
+
+                    # Futures complete out of order but are written in submission order
+                    if len(pending) >= max_in_flight:
+                        self._write_drawn_frame(writer, *pending.popleft())
+
+                while pending:
+                    self._write_drawn_frame(writer, *pending.popleft())
+        finally:
+            writer.release()
+            self._next_frame_num = first_frame + frames_read
+
+        print(f"Rendered {frames_read} frames to {out_path}")
+
+        return Path(out_path)
+
+    def _write_drawn_frame(self, writer: cv2.VideoWriter, future, frame: np.ndarray):
+        """Write a render_video result, then recycle the decoded frame buffer."""
+        writer.write(future.result())
+        self._frame_pool.release(frame)
+
+    def _read_video_frame(self, video_frame_num: int) -> Optional[np.ndarray]:
+        """
+        Decode one video frame, reusing cached frames and avoiding seeks.
+
+        Seeking makes the decoder rewind to the previous keyframe, so short
+        forward jumps are decoded through with grab() instead.
+
+        Args:
+            video_frame_num: Video frame number (0-indexed)
+
+        Returns:
+            Copy of the video frame (BGR format), safe to draw on, or None if failed
+        """
+        if video_frame_num in self._frame_cache:
+            self._frame_cache.move_to_end(video_frame_num)
+            return self._frame_cache[video_frame_num].copy()
+
+        gap = video_frame_num - self._next_frame_num
+        if 0 <= gap < self.MAX_FORWARD_DECODE:
+            for _ in range(gap):
+                self.video.grab()
         else:
-            print(f"Failed to read video frame {video_frame_num}")
+            self.video.set(cv2.CAP_PROP_POS_FRAMES, video_frame_num)
+
+        success, frame = self.video.read(self._frame_pool.acquire(self._frame_shape))
+        self._next_frame_num = video_frame_num + 1
+
+        if not success:
             return None
 
+        # Frames evicted from the cache become decode buffers again
+        self._frame_cache[video_frame_num] = frame
+        if len(self._frame_cache) > self.frame_cache_size:
+            self._frame_pool.release(self._frame_cache.popitem(last=False)[1])
+
+        return frame.copy()
+
     def find_sync_points_interactive(self) -> Dict[int, int]:
         """
         Interactive tool to identify sync points.
@@ -263,4 +553,7 @@ if __name__ == "__main__":
 
     # Get synced video frame
     frame = sync.get_synced_frame(tracking_frame_id=40)
+
+    # Render an overlaid clip, drawing frames in parallel
+    sync.render_video('overlaid_play.mp4', lambda frame, rows: draw_overlay(frame, rows))
     """)
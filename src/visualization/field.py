@@ -2,9 +2,18 @@
 NFL field visualization utilities.
 """
 
+import functools
+import math
+
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib.patches as patches
-from matplotlib.patches import Rectangle, Arc
+from matplotlib.patches import Rectangle, Arc, PathPatch
+from matplotlib.path import Path
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 import numpy as np
 from typing import Optional, Tuple
 
@@ -22,16 +31,43 @@ class NFLField:
     LINE_COLOR = 'white'
     END_ZONE_COLOR = '#1a3a0f'  # Darker green
 
-    def __init__(self, figsize: Tuple[float, float] = (12, 6.4)):
+    # Idle fields kept per figsize by acquire()/release()
+    _POOL_SIZE = 4
+    _pool = {}
+
+    # Yard numbers as (x, label), counting up to midfield and back down
+    _YARD_LABELS = tuple(
+        (yard, str(yard - 10 if yard <= 60 else 120 - yard))
+        for yard in range(20, 110, 10)
+    )
+
+    def __init__(
+        self,
+        figsize: Tuple[float, float] = (12, 6.4),
+        cache_background: bool = False,
+        raster_dynamic: bool = False
+    ):
         """
         Initialize NFL field.
 
         Args:
             figsize: Figure size (width, height) in inches
+            cache_background: Draw the static field as one cached image instead
+                of individual artists (faster redraws, raster at screen dpi)
+            raster_dynamic: Rasterize players, trajectories and the field itself
+                when saving to PDF/SVG, keeping only text as vector
         """
         self.figsize = figsize
+        self.cache_background = cache_background
+        self.raster_dynamic = raster_dynamic
         self.fig = None
         self.ax = None
+        self._scrimmage_line = None
+        self._first_down_line = None
+        self._static_artists = set()
+        self._tight_bbox = None
+        self._background = None
+        self._player_scatter = None
 
     def create_field(
         self,
@@ -51,131 +87,297 @@ class NFLField:
             Tuple of (figure, axes)
         """
         self.fig, self.ax = plt.subplots(figsize=self.figsize, dpi=100)
+        self._tight_bbox = None
 
         # Set field limits
         self.ax.set_xlim(0, self.FIELD_LENGTH)
         self.ax.set_ylim(0, self.FIELD_WIDTH)
 
+        if self.cache_background:
+            # Static markings come from a cached raster sized to this axes
+            self.ax.set_aspect('equal')
+            self.ax.apply_aspect()
+            bbox = self.ax.get_window_extent()
+            self.ax.imshow(
+                self._get_field_image(
+                    (round(bbox.width) / self.fig.dpi, round(bbox.height) / self.fig.dpi),
+                    self.fig.dpi,
+                    show_yard_labels
+                ),
+                extent=(0, self.FIELD_LENGTH, 0, self.FIELD_WIDTH),
+                interpolation='none',
+                zorder=0
+            )
+        else:
+            self._draw_static_field(self.ax, show_yard_labels)
+
+        # Line of scrimmage and first down line, created once and moved per play
+        self._scrimmage_line = self.ax.axvline(
+            0,
+            color='blue',
+            linewidth=2,
+            linestyle='--',
+            alpha=0.7,
+            zorder=2
+        )
+        self._first_down_line = self.ax.axvline(
+            0,
+            color='yellow',
+            linewidth=2,
+            linestyle='--',
+            alpha=0.7,
+            zorder=2
+        )
+        self.update_scrimmage(line_of_scrimmage, first_down_line)
+
+        # Everything drawn so far is kept when a pooled field is released
+        self._static_artists = set(self.ax.get_children())
+
+        # Remove axes
+        self.ax.set_aspect('equal')
+        self.ax.axis('off')
+
+        return self.fig, self.ax
+
+    def update_scrimmage(
+        self,
+        line_of_scrimmage: Optional[float] = None,
+        first_down_line: Optional[float] = None
+    ):
+        """
+        Move the line of scrimmage and first down line in place.
+
+        Args:
+            line_of_scrimmage: X-coordinate of line of scrimmage (None hides it)
+            first_down_line: X-coordinate of first down line (None hides it)
+        """
+        for line, x, label in (
+            (self._scrimmage_line, line_of_scrimmage, 'Line of Scrimmage'),
+            (self._first_down_line, first_down_line, 'First Down')
+        ):
+            if x is None:
+                line.set_visible(False)
+                line.set_label('_' + label)  # Keep hidden lines out of the legend
+            else:
+                line.set_xdata([x, x])
+                line.set_visible(True)
+                line.set_label(label)
+
+    @classmethod
+    def acquire(
+        cls,
+        figsize: Tuple[float, float] = (12, 6.4),
+        line_of_scrimmage: Optional[float] = None,
+        first_down_line: Optional[float] = None
+    ) -> 'NFLField':
+        """
+        Get a field with its figure already built, reusing a released one if possible.
+
+        Args:
+            figsize: Figure size (width, height) in inches
+            line_of_scrimmage: X-coordinate of line of scrimmage
+            first_down_line: X-coordinate of first down line
+
+        Returns:
+            NFLField with fig and ax ready for plotting
+        """
+        idle = cls._pool.get(tuple(figsize))
+        if idle:
+            field = idle.pop()
+            field.update_scrimmage(line_of_scrimmage, first_down_line)
+            return field
+
+        field = cls(figsize=figsize)
+        field.create_field(line_of_scrimmage, first_down_line)
+        # Limits are fixed to the field, so skip autoscaling as artists are added
+        field.ax.set_autoscale_on(False)
+        return field
+
+    def release(self):
+        """
+        Clear everything plotted on top of the field and return it to the pool.
+
+        The field must not be used again until it is handed out by acquire().
+        """
+        for artist in self.ax.get_children():
+            if artist not in self._static_artists:
+                artist.remove()
+        self.ax.set_title('')
+        self._tight_bbox = None
+        self._background = None
+        self._player_scatter = None
+
+        idle = self._pool.setdefault(tuple(self.figsize), [])
+        if len(idle) < self._POOL_SIZE:
+            idle.append(self)
+        else:
+            plt.close(self.fig)
+
+    @classmethod
+    def _draw_static_field(cls, ax: plt.Axes, show_yard_labels: bool = True):
+        """
+        Draw the field surface, yard lines, numbers and hash marks.
+
+        Args:
+            ax: Axes to draw on
+            show_yard_labels: Whether to show yard line labels
+        """
         # Field background
-        self.ax.add_patch(Rectangle(
+        ax.add_patch(Rectangle(
             (0, 0),
-            self.FIELD_LENGTH,
-            self.FIELD_WIDTH,
-            facecolor=self.FIELD_COLOR,
+            cls.FIELD_LENGTH,
+            cls.FIELD_WIDTH,
+            facecolor=cls.FIELD_COLOR,
             zorder=0
         ))
 
-        # End zones
-        self.ax.add_patch(Rectangle(
-            (0, 0),
-            self.END_ZONE_LENGTH,
-            self.FIELD_WIDTH,
-            facecolor=self.END_ZONE_COLOR,
+        # End zones, both as subpaths of one patch (one draw call)
+        ax.add_patch(PathPatch(
+            cls._end_zone_path(),
+            facecolor=cls.END_ZONE_COLOR,
+            edgecolor='none',
             alpha=0.3,
             zorder=0
         ))
 
-        self.ax.add_patch(Rectangle(
-            (110, 0),
-            self.END_ZONE_LENGTH,
-            self.FIELD_WIDTH,
-            facecolor=self.END_ZONE_COLOR,
-            alpha=0.3,
-            zorder=0
+        # Draw yard lines (every 5 yards, heavier every 10) as one collection each
+        major_lines, minor_lines, hash_marks = cls._field_segments()
+        ax.add_collection(LineCollection(
+            major_lines,
+            colors=cls.LINE_COLOR,
+            linewidths=1.5,
+            alpha=0.7,
+            capstyle='projecting',
+            zorder=1
+        ))
+        ax.add_collection(LineCollection(
+            minor_lines,
+            colors=cls.LINE_COLOR,
+            linewidths=0.8,
+            alpha=0.7,
+            capstyle='projecting',
+            zorder=1
         ))
 
-        # Draw yard lines
-        for yard in range(10, 110, 5):
-            # Major yard lines (every 5 yards)
-            linewidth = 1.5 if yard % 10 == 0 else 0.8
-            self.ax.plot(
-                [yard, yard],
-                [0, self.FIELD_WIDTH],
-                color=self.LINE_COLOR,
-                linewidth=linewidth,
-                alpha=0.7,
-                zorder=1
-            )
-
-            # Yard numbers
-            if show_yard_labels and yard % 10 == 0:
-                yard_num = yard - 10 if yard <= 60 else 120 - yard
-                if 10 < yard < 110:
-                    # Left side
-                    self.ax.text(
-                        yard, 5,
-                        str(yard_num),
-                        color=self.LINE_COLOR,
+        # Yard numbers: upright along the near sideline, upside down along the far one
+        if show_yard_labels:
+            for label_y, rotation in ((5, 0), (cls.FIELD_WIDTH - 5, 180)):
+                for yard, label in cls._YARD_LABELS:
+                    ax.text(
+                        yard, label_y,
+                        label,
+                        color=cls.LINE_COLOR,
                         fontsize=14,
                         fontweight='bold',
                         ha='center',
                         va='center',
-                        rotation=0,
-                        zorder=1
-                    )
-                    # Right side
-                    self.ax.text(
-                        yard, self.FIELD_WIDTH - 5,
-                        str(yard_num),
-                        color=self.LINE_COLOR,
-                        fontsize=14,
-                        fontweight='bold',
-                        ha='center',
-                        va='center',
-                        rotation=180,
+                        rotation=rotation,
                         zorder=1
                     )
 
-        # Draw hash marks
-        for yard in range(10, 110):
-            # Left hash
-            self.ax.plot(
-                [yard, yard],
-                [18.5, 19.5],
-                color=self.LINE_COLOR,
-                linewidth=0.5,
-                alpha=0.5,
-                zorder=1
-            )
-            # Right hash
-            self.ax.plot(
-                [yard, yard],
-                [self.FIELD_WIDTH - 19.5, self.FIELD_WIDTH - 18.5],
-                color=self.LINE_COLOR,
-                linewidth=0.5,
+        # Draw hash marks (left and right) as one collection each
+        for segments in hash_marks:
+            ax.add_collection(LineCollection(
+                segments,
+                colors=cls.LINE_COLOR,
+                linewidths=0.5,
                 alpha=0.5,
+                capstyle='projecting',
                 zorder=1
-            )
+            ))
 
-        # Line of scrimmage
-        if line_of_scrimmage is not None:
-            self.ax.axvline(
-                line_of_scrimmage,
-                color='blue',
-                linewidth=2,
-                linestyle='--',
-                alpha=0.7,
-                zorder=2,
-                label='Line of Scrimmage'
-            )
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _end_zone_path(cls) -> Path:
+        """
+        Compound path with one closed rectangle per end zone.
 
-        # First down line
-        if first_down_line is not None:
-            self.ax.axvline(
-                first_down_line,
-                color='yellow',
-                linewidth=2,
-                linestyle='--',
-                alpha=0.7,
-                zorder=2,
-                label='First Down'
-            )
+        Returns:
+            Path with two subpaths
+        """
+        verts = []
+        for x0 in (0, cls.FIELD_LENGTH - cls.END_ZONE_LENGTH):
+            x1 = x0 + cls.END_ZONE_LENGTH
+            verts += [(x0, 0), (x1, 0), (x1, cls.FIELD_WIDTH), (x0, cls.FIELD_WIDTH), (x0, 0)]
+        codes = [Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY] * 2
+        return Path(verts, codes, readonly=True)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _field_segments(cls) -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Segment arrays for the fixed field markings, built once per class.
 
-        # Remove axes
-        self.ax.set_aspect('equal')
-        self.ax.axis('off')
+        Returns:
+            Tuple of (major yard lines, minor yard lines, (left hashes, right hashes)),
+            each a read-only array of shape (N, 2, 2)
+        """
+        yards = np.arange(10, 110, 5)
+        yard_lines = cls._vertical_segments(yards, 0, cls.FIELD_WIDTH)
+        major = yards % 10 == 0
+
+        hash_yards = np.arange(10, 110)
+        hash_marks = tuple(
+            cls._vertical_segments(hash_yards, y0, y1)
+            for y0, y1 in [(18.5, 19.5), (cls.FIELD_WIDTH - 19.5, cls.FIELD_WIDTH - 18.5)]
+        )
 
-        return self.fig, self.ax
+        segments = (yard_lines[major], yard_lines[~major], *hash_marks)
+        for array in segments:
+            array.flags.writeable = False
+        return segments[0], segments[1], segments[2:]
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _get_field_image(
+        cls,
+        size: Tuple[float, float],
+        dpi: float,
+        show_yard_labels: bool = True
+    ) -> np.ndarray:
+        """
+        Render the static field once into an off-screen RGBA image.
+
+        Args:
+            size: Size of the field area (width, height) in inches
+            dpi: Resolution the image will be displayed at
+            show_yard_labels: Whether to show yard line labels
+
+        Returns:
+            RGBA image array, shape (height, width, 4)
+        """
+        fig = Figure(figsize=size, dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.set_xlim(0, cls.FIELD_LENGTH)
+        ax.set_ylim(0, cls.FIELD_WIDTH)
+        ax.axis('off')
+        cls._draw_static_field(ax, show_yard_labels)
+
+        canvas.draw()
+        image = np.asarray(canvas.buffer_rgba()).copy()
+        image.flags.writeable = False
+        return image
+
+    @staticmethod
+    def _vertical_segments(xs: np.ndarray, y0: float, y1: float) -> np.ndarray:
+        """
+        Build vertical line segments for a LineCollection.
+
+        Args:
+            xs: X-coordinate of each segment
+            y0: Bottom Y-coordinate shared by all segments
+            y1: Top Y-coordinate shared by all segments
+
+        Returns:
+            Array of segments, shape (N, 2, 2)
+        """
+        # One output allocation; x and the shared endpoints are broadcast into it
+        xs = np.asarray(xs, dtype=float)
+        segments = np.empty((len(xs), 2, 2))
+        segments[:, :, 0] = xs[:, None]
+        segments[:, :, 1] = (y0, y1)
+        return segments
 
     def plot_players(
         self,
@@ -199,6 +401,7 @@ class NFLField:
             size: Marker size
             alpha: Transparency
         """
+        self._tight_bbox = None  # Content may now extend past the field
         if colors is None:
             colors = {
                 'offense': '#FF6B6B',  # Red
@@ -206,38 +409,132 @@ class NFLField:
                 'football': '#FFD93D'   # Yellow
             }
 
-        unique_teams = np.unique(team)
+        # float32 is ample at display resolution and halves the coordinate copies
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        team = np.asarray(team)
+
+        # One scatter for everyone; grouping by team keeps the old stacking
+        # order (teams drawn in sorted order, later teams on top)
+        order = np.argsort(team, kind='stable')
+        x, y, team = x[order], y[order], team[order]
+
+        # Team blocks split wherever the sorted team changes, so no second
+        # sort through np.unique
+        changes = np.flatnonzero(team[1:] != team[:-1]) + 1
+        starts = np.concatenate(([0], changes)) if len(team) else changes
+        ends = np.append(changes, len(team))
+        unique_teams = team[starts]
+        team_colors = {t: colors.get(t, 'gray') for t in unique_teams}
+
+        # Fill an RGBA array one team block at a time so the scatter takes
+        # colors as-is instead of parsing one color string per player
+        rgba = np.empty((len(team), 4), dtype=np.float32)
+        for t, start, end in zip(unique_teams, starts, ends):
+            rgba[start:end] = to_rgba(team_colors[t])
+
+        self.ax.scatter(
+            x,
+            y,
+            c=rgba,
+            s=size,
+            alpha=alpha,
+            edgecolors='white',
+            linewidths=1.5,
+            zorder=10,
+            rasterized=self.raster_dynamic
+        )
 
+        # Empty proxy artists give the legend one entry per team
         for t in unique_teams:
-            mask = team == t
-            color = colors.get(t, 'gray')
-
-            self.ax.scatter(
-                x[mask],
-                y[mask],
-                c=color,
-                s=size,
+            self.ax.add_line(Line2D(
+                [], [],
+                linestyle='none',
+                marker='o',
+                markersize=np.sqrt(size),
+                markerfacecolor=team_colors[t],
+                markeredgecolor='white',
+                markeredgewidth=1.5,
                 alpha=alpha,
-                edgecolors='white',
-                linewidths=1.5,
-                zorder=10,
                 label=t
-            )
+            ))
+
+        # Add jersey numbers (NaN, e.g. the football, gets none)
+        if numbers is not None:
+            numbers = np.asarray(numbers, dtype=float)[order]
+            valid = ~np.isnan(numbers)
+            labels = numbers[valid].astype(int).astype(str)
+            for xi, yi, label in zip(x[valid], y[valid], labels):
+                self.ax.text(
+                    xi, yi,
+                    label,
+                    color='white',
+                    fontsize=8,
+                    fontweight='bold',
+                    ha='center',
+                    va='center',
+                    zorder=11
+                )
+
+    def prepare_for_animation(
+        self,
+        size: float = 100,
+        alpha: float = 0.8
+    ):
+        """
+        Set up blitted player updates on top of everything drawn so far.
+
+        Draws the figure once, keeps the rendered field as the blit background
+        and adds an animated player scatter that blit_players() moves per frame.
+
+        Args:
+            size: Marker size
+            alpha: Transparency
+
+        Returns:
+            The animated player scatter (PathCollection)
+        """
+        self._player_scatter = self.ax.scatter(
+            np.empty(0),
+            np.empty(0),
+            s=size,
+            alpha=alpha,
+            edgecolors='white',
+            linewidths=1.5,
+            zorder=10,
+            animated=True
+        )
+
+        # Animated artists are skipped by a full draw, so the background is
+        # the field and everything else without the players
+        self.fig.canvas.draw()
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+
+        return self._player_scatter
+
+    def blit_players(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        facecolors: Optional[np.ndarray] = None
+    ):
+        """
+        Redraw only the players for one animation frame.
+
+        Args:
+            x: X-coordinates of players
+            y: Y-coordinates of players
+            facecolors: Colors per player (optional, kept from the last frame if None)
+        """
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
 
-            # Add jersey numbers
-            if numbers is not None:
-                for xi, yi, num in zip(x[mask], y[mask], numbers[mask]):
-                    if not pd.isna(num):
-                        self.ax.text(
-                            xi, yi,
-                            str(int(num)),
-                            color='white',
-                            fontsize=8,
-                            fontweight='bold',
-                            ha='center',
-                            va='center',
-                            zorder=11
-                        )
+        self._player_scatter.set_offsets(np.column_stack([x, y]))
+        if facecolors is not None:
+            self._player_scatter.set_facecolor(facecolors)
+
+        self.ax.draw_artist(self._player_scatter)
+        canvas.blit(self.ax.bbox)
 
     def plot_ball_trajectory(
         self,
@@ -259,13 +556,21 @@ class NFLField:
             alpha: Transparency
             show_direction: Whether to show direction arrows
         """
-        # Plot trajectory line
+        self._tight_bbox = None  # Content may now extend past the field
+        # Positional float32 arrays (a Series would index by label below)
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
+
+        # Plot trajectory line. Ball paths are a few hundred samples at most, where
+        # matplotlib's default path simplification already applies; raising
+        # simplify_threshold or agg.path.chunksize only helps past ~5k points
         self.ax.plot(
             x, y,
             color=color,
             linewidth=linewidth,
             alpha=alpha,
             zorder=9,
+            rasterized=self.raster_dynamic,
             label='Ball Trajectory'
         )
 
@@ -278,6 +583,7 @@ class NFLField:
             edgecolors='white',
             linewidths=2,
             zorder=10,
+            rasterized=self.raster_dynamic,
             label='Release'
         )
 
@@ -289,26 +595,43 @@ class NFLField:
             edgecolors='white',
             linewidths=2,
             zorder=10,
+            rasterized=self.raster_dynamic,
             label='Target'
         )
 
         # Add direction arrows
         if show_direction and len(x) > 5:
-            # Arrow at midpoint
+            # Arrow at midpoint; the two samples come out as plain floats so
+            # the arithmetic below avoids NumPy scalar boxing
             mid_idx = len(x) // 2
-            dx = x[mid_idx + 1] - x[mid_idx]
-            dy = y[mid_idx + 1] - y[mid_idx]
-
-            self.ax.arrow(
-                x[mid_idx], y[mid_idx],
-                dx * 2, dy * 2,
-                head_width=2,
-                head_length=1.5,
-                fc=color,
-                ec=color,
-                alpha=alpha,
-                zorder=9
-            )
+            (x0, x1), (y0, y1) = x[mid_idx:mid_idx + 2].tolist(), y[mid_idx:mid_idx + 2].tolist()
+            dx = x1 - x0
+            dy = y1 - y0
+
+            # One quiver arrow rather than a FancyArrow patch, sized like the
+            # old ax.arrow: hairline shaft, 2 x 1.5 yard head past the shaft end
+            shaft = math.hypot(dx, dy) * 2
+            if shaft > 0:
+                stretch = (shaft + 1.5) / shaft
+                shaft_width = 0.001
+                self.ax.quiver(
+                    x0, y0,
+                    dx * 2 * stretch, dy * 2 * stretch,
+                    color=color,
+                    edgecolor=color,
+                    linewidth=1,
+                    alpha=alpha,
+                    angles='xy',
+                    scale_units='xy',
+                    scale=1,
+                    units='xy',
+                    width=shaft_width,
+                    headwidth=2 / shaft_width,
+                    headlength=1.5 / shaft_width,
+                    headaxislength=1.5 / shaft_width,
+                    zorder=9,
+                    rasterized=self.raster_dynamic
+                )
 
     def add_title(
         self,
@@ -324,6 +647,7 @@ class NFLField:
             subtitle: Subtitle (optional)
             fontsize: Font size for title
         """
+        self._tight_bbox = None  # Content may now extend past the field
         title_text = title
         if subtitle:
             title_text += f"\n{subtitle}"
@@ -338,6 +662,7 @@ class NFLField:
 
     def add_legend(self, loc: str = 'upper right'):
         """Add legend to the field."""
+        self._tight_bbox = None  # Content may now extend past the field
         self.ax.legend(
             loc=loc,
             framealpha=0.8,
@@ -352,7 +677,33 @@ class NFLField:
             filepath: Output file path
             dpi: Resolution
             bbox_inches: Bounding box setting
+
+        With bbox_inches='tight' the box is measured at the save dpi and reused
+        for that dpi until the plot changes through this class (plotting,
+        titles, legend, release) or an artist is added to or removed from the
+        axes directly.
         """
+        # Vector output: the field layers (zorder < 5) go into one raster too
+        if self.raster_dynamic and str(filepath).lower().endswith(('.pdf', '.svg')):
+            self.ax.set_rasterization_zorder(5)
+
+        # Reuse the tight box while the content is unchanged instead of letting
+        # savefig do an extra layout pass; unclipped text (titles, jersey
+        # numbers of out-of-bounds players) can move it
+        if bbox_inches == 'tight':
+            key = (len(self.ax.get_children()), dpi)
+            if self._tight_bbox is None or self._tight_bbox[0] != key:
+                # Text extents depend on dpi, so measure at the save resolution
+                screen_dpi = self.fig.dpi
+                self.fig.dpi = dpi
+                try:
+                    renderer = self.fig.canvas.get_renderer()
+                    bbox = self.fig.get_tightbbox(renderer).padded(plt.rcParams['savefig.pad_inches'])
+                finally:
+                    self.fig.dpi = screen_dpi
+                self._tight_bbox = (key, bbox)
+            bbox_inches = self._tight_bbox[1]
+
         self.fig.savefig(
             filepath,
             dpi=dpi,
@@ -363,8 +714,6 @@ class NFLField:
 
 if __name__ == "__main__":
     # Example usage
-    import pandas as pd
-
     field = NFLField()
     field.create_field(line_of_scrimmage=30, first_down_line=40)
 